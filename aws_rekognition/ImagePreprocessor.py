@@ -0,0 +1,176 @@
+from PIL import Image, ImageChops, ImageOps
+from io import BytesIO
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+# Longest side sent to Rekognition. Pill imprints stay well above the minimum
+# legible text height at this size while the payload shrinks by an order of
+# magnitude for typical phone photos.
+REKOGNITION_MAX_DIM = int(os.getenv("REKOGNITION_MAX_DIM", 1280))
+REKOGNITION_JPEG_QUALITY = int(os.getenv("REKOGNITION_JPEG_QUALITY", 85))
+
+# Longest side of the thumbnail served back to the UI
+THUMBNAIL_MAX_DIM = int(os.getenv("THUMBNAIL_MAX_DIM", 320))
+THUMBNAIL_JPEG_QUALITY = 75
+
+# Crop to the pill before downscaling (off by default)
+PILL_CROP = os.getenv("PILL_CROP", "0") == "1"
+
+
+class ImagePreprocessor:
+    def __init__(self, image_bin: bytes, crop: Optional[bool] = None) -> None:
+        self.image_data = image_bin
+        self.crop = PILL_CROP if crop is None else crop
+
+    def process(self) -> Dict:
+        """
+        Decode the upload once and produce a compact Rekognition payload and a
+        UI thumbnail. Both are re-encoded as JPEG without EXIF metadata, after
+        applying the EXIF orientation.
+
+        Returns:
+            Dictionary with the processed image, thumbnail and size stats
+
+        Example Response:
+            {
+                'image': b'...',
+                'thumbnail': b'...',
+                'stats': {
+                    'raw_bytes': 4213347,
+                    'processed_bytes': 182210,
+                    'thumbnail_bytes': 11873,
+                    'reduction_pct': 95.7,
+                    'original_size': (4032, 3024),
+                    'processed_size': (1280, 960),
+                    'cropped': False,
+                    'elapsed_ms': 84.2
+                }
+            }
+        """
+        start = time.perf_counter()
+        with Image.open(BytesIO(self.image_data)) as img:
+            original_size = img.size
+            img = ImageOps.exif_transpose(img)
+            img = self._to_rgb(img)
+
+        cropped = False
+        if self.crop:
+            box = self._pill_bbox(img)
+            if box:
+                img = img.crop(box)
+                cropped = True
+
+        img.thumbnail((REKOGNITION_MAX_DIM, REKOGNITION_MAX_DIM), Image.LANCZOS)
+        image_bytes = self._encode(img, REKOGNITION_JPEG_QUALITY)
+        processed_size = img.size
+
+        img.thumbnail((THUMBNAIL_MAX_DIM, THUMBNAIL_MAX_DIM), Image.LANCZOS)
+        thumbnail_bytes = self._encode(img, THUMBNAIL_JPEG_QUALITY)
+
+        raw_bytes = len(self.image_data)
+        return {
+            "image": image_bytes,
+            "thumbnail": thumbnail_bytes,
+            "stats": {
+                "raw_bytes": raw_bytes,
+                "processed_bytes": len(image_bytes),
+                "thumbnail_bytes": len(thumbnail_bytes),
+                "reduction_pct": round(100 * (1 - len(image_bytes) / raw_bytes), 1)
+                if raw_bytes
+                else 0.0,
+                "original_size": original_size,
+                "processed_size": processed_size,
+                "cropped": cropped,
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            },
+        }
+
+    @staticmethod
+    def _to_rgb(img: Image.Image) -> Image.Image:
+        """Flatten transparency onto white so JPEG encoding keeps the imprint."""
+        if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+            img = img.convert("RGBA")
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel("A"))
+            return background
+        return img.convert("RGB")
+
+    @staticmethod
+    def _pill_bbox(img: Image.Image) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Estimate the pill region as everything that differs from the border
+        colour, padded by 10%. Returns None when the estimate looks unreliable
+        (nearly empty or nearly the whole frame).
+        """
+        small = img.convert("L")
+        small.thumbnail((256, 256))
+        width, height = small.size
+        corners = [
+            small.getpixel((0, 0)),
+            small.getpixel((width - 1, 0)),
+            small.getpixel((0, height - 1)),
+            small.getpixel((width - 1, height - 1)),
+        ]
+        background = sorted(corners)[len(corners) // 2]
+        diff = ImageChops.difference(small, Image.new("L", small.size, background))
+        mask = diff.point(lambda v: 255 if v > 30 else 0)
+        box = mask.getbbox()
+        if not box:
+            return None
+
+        left, top, right, bottom = box
+        area = (right - left) * (bottom - top) / float(width * height)
+        if area < 0.05 or area > 0.9:
+            return None
+
+        pad_x = (right - left) // 10
+        pad_y = (bottom - top) // 10
+        scale_x = img.width / float(width)
+        scale_y = img.height / float(height)
+        return (
+            max(0, int((left - pad_x) * scale_x)),
+            max(0, int((top - pad_y) * scale_y)),
+            min(img.width, int((right + pad_x) * scale_x)),
+            min(img.height, int((bottom + pad_y) * scale_y)),
+        )
+
+    @staticmethod
+    def _encode(img: Image.Image, quality: int) -> bytes:
+        buffer = BytesIO()
+        # No exif= argument: metadata from the upload is not carried over
+        img.save(buffer, format="JPEG", quality=quality, optimize=True)
+        return buffer.getvalue()
+
+
+if __name__ == "__main__":
+    # Compare payload size and Rekognition latency for raw vs preprocessed
+    # uploads. Usage: python -m aws_rekognition.ImagePreprocessor pill.jpg ...
+    import sys
+    from dotenv import load_dotenv
+    from aws_rekognition.RekognitionTextExtractor import RekognitionTextExtractor
+
+    load_dotenv()
+    for path in sys.argv[1:]:
+        with open(path, "rb") as f:
+            raw = f.read()
+        prepared = ImagePreprocessor(raw).process()
+
+        raw_extractor = RekognitionTextExtractor(raw)
+        raw_results = raw_extractor.extract_text()
+        processed_extractor = RekognitionTextExtractor(prepared["image"])
+        processed_results = processed_extractor.extract_text()
+
+        stats = prepared["stats"]
+        print(f"{path}:")
+        print(
+            f"  bytes      raw={stats['raw_bytes']} processed={stats['processed_bytes']}"
+            f" ({stats['reduction_pct']}% smaller)"
+        )
+        print(
+            f"  rekognition raw={raw_extractor.latency_ms}ms"
+            f" processed={processed_extractor.latency_ms}ms"
+            f" (+{stats['elapsed_ms']}ms preprocessing)"
+        )
+        print(f"  text       raw={[r['text'] for r in raw_results]}")
+        print(f"             processed={[r['text'] for r in processed_results]}")
@@ -1,18 +1,38 @@
-import boto3
-from botocore.exceptions import ClientError
 import os
+import threading
+import time
 from typing import List, Dict
 
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_rekognition_client():
+    """
+    Return the process-wide Rekognition client, importing boto3 and building
+    the client on first use. boto3 clients are thread-safe, so one client (and
+    its connection pool) is shared by every request.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import boto3
+
+                _client = boto3.client(
+                    "rekognition",
+                    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+                    region_name=os.getenv("AWS_REGION", "us-east-1"),
+                )
+    return _client
+
 
 class RekognitionTextExtractor:
     def __init__(self, image_bin: bytes) -> None:
-        self.client = boto3.client(
-            "rekognition",
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            region_name=os.getenv("AWS_REGION", "us-east-1"),
-        )
+        self.client = get_rekognition_client()
         self.image_data = image_bin
+        self.latency_ms: float = 0.0  # wall time of the last detect_text call
 
     def extract_text(self) -> List[Dict]:
         """
@@ -35,8 +55,12 @@ class RekognitionTextExtractor:
                 }
             ]
         """
+        from botocore.exceptions import ClientError
+
         try:
+            start = time.perf_counter()
             response = self.client.detect_text(Image={"Bytes": self.image_data})
+            self.latency_ms = round((time.perf_counter() - start) * 1000, 1)
 
             return [
                 {
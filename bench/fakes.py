@@ -0,0 +1,310 @@
+"""
+Local stand-ins for the external services the server talks to.
+
+Each fake is a threaded HTTP server on 127.0.0.1 with a configurable response
+latency and a per-path call counter, so a benchmark can attribute external
+calls to the endpoint being driven.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _compact(text):
+    return "".join(str(text).split()).upper()
+
+
+class FakeServer:
+    """Base class: runs ``handle(handler)`` for every request on a thread."""
+
+    name = "fake"
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = Counter()
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                fake._dispatch(self)
+
+            def do_POST(self):
+                fake._dispatch(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever, name=f"{self.name}-server", daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def reset_calls(self):
+        with self._lock:
+            self.calls.clear()
+
+    def call_counts(self):
+        with self._lock:
+            return dict(self.calls)
+
+    def _dispatch(self, handler):
+        path = urlparse(handler.path).path
+        with self._lock:
+            self.calls[path] += 1
+        length = int(handler.headers.get("Content-Length", 0) or 0)
+        body = handler.rfile.read(length) if length else b""
+        if self.latency:
+            time.sleep(self.latency)
+        self.handle(handler, body)
+
+    def handle(self, handler, body):
+        raise NotImplementedError
+
+    @staticmethod
+    def send(handler, status, payload, content_type="application/json"):
+        if not isinstance(payload, bytes):
+            payload = payload.encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+
+class FakeRekognition(FakeServer):
+    """
+    Speaks the Rekognition JSON protocol for DetectText. Point boto3 at it with
+    AWS_ENDPOINT_URL_REKOGNITION. Each configured line is returned as a LINE
+    detection stacked top to bottom.
+    """
+
+    name = "rekognition"
+
+    def __init__(self, lines=("AN", "715"), latency=0.0):
+        super().__init__(latency)
+        self.lines = list(lines)
+
+    def handle(self, handler, body):
+        target = handler.headers.get("X-Amz-Target", "")
+        if not target.endswith("DetectText"):
+            self.send(handler, 400, json.dumps({"__type": "InvalidRequestException"}))
+            return
+
+        detections = []
+        height = 0.8 / max(len(self.lines), 1)
+        for i, text in enumerate(self.lines):
+            box = {"Width": 0.4, "Height": height * 0.8, "Left": 0.3, "Top": 0.1 + i * height}
+            detections.append(
+                {
+                    "DetectedText": text,
+                    "Type": "LINE",
+                    "Id": i,
+                    "Confidence": 97.5,
+                    "Geometry": {"BoundingBox": box, "Polygon": []},
+                }
+            )
+        payload = {"TextDetections": detections, "TextModelVersion": "3.0"}
+        self.send(handler, 200, json.dumps(payload), "application/x-amz-json-1.1")
+
+
+class FakeDrugsCom(FakeServer):
+    """
+    Serves /imprints.php from fixture HTML. Imprints listed in ``known`` get a
+    results page (matched ignoring spaces and case); anything else gets the
+    empty results page.
+    """
+
+    name = "drugs_com"
+
+    def __init__(self, known=None, generic_name="Lisinopril", latency=0.0):
+        super().__init__(latency)
+        self.known = {_compact(i) for i in (known or ["AN 715"])}
+        self.generic_name = generic_name
+        self.results_page = _read_fixture("imprint_page.html")
+        self.empty_page = _read_fixture("no_results_page.html")
+
+    def handle(self, handler, body):
+        query = parse_qs(urlparse(handler.path).query)
+        imprint = query.get("imprint", [""])[0]
+        page = self.results_page if _compact(imprint) in self.known else self.empty_page
+        html = page.replace("{imprint}", imprint).replace("{generic_name}", self.generic_name)
+        self.send(handler, 200, html, "text/html; charset=utf-8")
+
+
+class FakeOpenFDA(FakeServer):
+    """
+    Serves /drug/label.json from a recorded openFDA label. Generic names in
+    ``missing`` get openFDA's 404 "No matches found!" response.
+    """
+
+    name = "openfda"
+
+    def __init__(self, missing=(), latency=0.0):
+        super().__init__(latency)
+        self.missing = {m.upper() for m in missing}
+        self.label = _read_fixture("fda_label.json")
+
+    def handle(self, handler, body):
+        search = parse_qs(urlparse(handler.path).query).get("search", [""])[0]
+        generic_name = search.split(":", 1)[-1].strip('"').upper()
+        if generic_name in self.missing:
+            error = {"error": {"code": "NOT_FOUND", "message": "No matches found!"}}
+            self.send(handler, 404, json.dumps(error))
+            return
+        self.send(handler, 200, self.label)
+
+
+class FakeOpenAI(FakeServer):
+    """
+    OpenAI-compatible /v1/chat/completions. ``latency`` is the time to first
+    byte; with ``stream: true`` the reply is sent as ``chunks`` SSE events
+    spaced ``chunk_delay`` seconds apart.
+    """
+
+    name = "openai"
+
+    def __init__(self, latency=0.0, chunks=8, chunk_delay=0.0, reply=None):
+        super().__init__(latency)
+        self.chunks = chunks
+        self.chunk_delay = chunk_delay
+        self.reply = reply or (
+            "This medicine is used to treat high blood pressure by relaxing "
+            "blood vessels so the heart can pump more easily."
+        )
+
+    def handle(self, handler, body):
+        request = json.loads(body or b"{}")
+        model = request.get("model", "gpt-4o-mini")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+
+        if not request.get("stream"):
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": self.reply},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            }
+            self.send(handler, 200, json.dumps(payload))
+            return
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Cache-Control", "no-cache")
+        handler.send_header("Connection", "close")
+        handler.end_headers()
+        words = self.reply.split(" ")
+        size = max(1, -(-len(words) // self.chunks))
+        pieces = [" ".join(words[i:i + size]) + " " for i in range(0, len(words), size)]
+        for i, piece in enumerate(pieces):
+            delta = {"content": piece}
+            if i == 0:
+                delta["role"] = "assistant"
+            self._send_event(handler, completion_id, created, model, delta, None)
+            if self.chunk_delay:
+                time.sleep(self.chunk_delay)
+        self._send_event(handler, completion_id, created, model, {}, "stop")
+        handler.wfile.write(b"data: [DONE]\n\n")
+        handler.wfile.flush()
+        handler.close_connection = True
+
+    @staticmethod
+    def _send_event(handler, completion_id, created, model, delta, finish_reason):
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        handler.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+        handler.wfile.flush()
+
+
+class FakeExternals:
+    """Starts all fakes and exposes the environment that points the app at them."""
+
+    def __init__(
+        self,
+        imprint_lines=("AN", "715"),
+        known_imprints=("AN 715",),
+        generic_name="Lisinopril",
+        rekognition_latency=0.0,
+        drugs_com_latency=0.0,
+        openfda_latency=0.0,
+        openai_latency=0.0,
+        openai_chunks=8,
+        openai_chunk_delay=0.0,
+    ):
+        self.rekognition = FakeRekognition(imprint_lines, rekognition_latency)
+        self.drugs_com = FakeDrugsCom(known_imprints, generic_name, drugs_com_latency)
+        self.openfda = FakeOpenFDA(latency=openfda_latency)
+        self.openai = FakeOpenAI(openai_latency, openai_chunks, openai_chunk_delay)
+        self.servers = [self.rekognition, self.drugs_com, self.openfda, self.openai]
+
+    def start(self):
+        for server in self.servers:
+            server.start()
+        return self
+
+    def stop(self):
+        for server in self.servers:
+            server.stop()
+
+    def reset_calls(self):
+        for server in self.servers:
+            server.reset_calls()
+
+    def call_counts(self):
+        """Total external calls per service since the last reset."""
+        return {server.name: sum(server.call_counts().values()) for server in self.servers}
+
+    def env(self):
+        return {
+            "AWS_ENDPOINT_URL_REKOGNITION": self.rekognition.url,
+            "AWS_ACCESS_KEY_ID": "bench",
+            "AWS_SECRET_ACCESS_KEY": "bench",
+            "AWS_REGION": "us-east-1",
+            "DRUGS_COM_BASE_URL": self.drugs_com.url,
+            "FDA_BASE_URL": f"{self.openfda.url}/drug",
+            "OPENAI_BASE_URL": f"{self.openai.url}/v1",
+            "OPENAI_API_KEY": "bench",
+        }
@@ -0,0 +1,332 @@
+"""
+End-to-end load test for /extract_imprint, /get_pill_info and /conversation.
+
+All external services (Rekognition, drugs.com, openFDA, OpenAI) are replaced
+by the local fakes in bench/fakes.py; Redis must be running locally. The app
+under test is pointed at its own Redis database (--redis-db, default 15), which
+is flushed before and after every run.
+
+Usage:
+    # Start fakes, boot the app in-process and drive it
+    python -m bench.run --requests 200 --concurrency 16
+
+    # Launch the server as a subprocess wired to the fakes and drive it
+    python -m bench.run --serve-cmd "python server.py" --serve-url http://127.0.0.1:6969
+
+    # Compare two saved runs
+    python -m bench.run --compare bench/results/a.json bench/results/b.json
+"""
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from io import BytesIO
+
+import requests
+
+from bench.fakes import FakeExternals
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+ENDPOINTS = ("extract_imprint", "get_pill_info", "conversation")
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def make_test_image(width=2400, height=1800):
+    """A large, phone-sized JPEG so preprocessing does real work."""
+    from PIL import Image, ImageDraw
+
+    img = Image.new("RGB", (width, height), (40, 90, 60))
+    draw = ImageDraw.Draw(img)
+    cx, cy, r = width // 2, height // 2, min(width, height) // 4
+    draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=(235, 180, 190))
+    buffer = BytesIO()
+    img.save(buffer, format="JPEG", quality=95)
+    return buffer.getvalue()
+
+
+def flush_redis(db):
+    """Empty the bench's Redis database so runs neither see nor leave keys."""
+    import redis
+
+    client = redis.Redis(
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", 6379)),
+        db=db,
+    )
+    client.flushdb()
+    client.close()
+
+
+def start_app(env):
+    """Import the Flask app with the fakes' env and serve it on a thread."""
+    os.environ.update(env)
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    from werkzeug.serving import make_server
+    import server
+
+    httpd = make_server("127.0.0.1", 0, server.app, threaded=True)
+    threading.Thread(target=httpd.serve_forever, name="bench-app", daemon=True).start()
+    return httpd, f"http://127.0.0.1:{httpd.server_port}"
+
+
+def start_subprocess(cmd, url, env, timeout=60):
+    """Run ``cmd`` with the fakes' env and wait until ``url`` answers."""
+    proc = subprocess.Popen(shlex.split(cmd), env={**os.environ, **env})
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server command exited with {proc.returncode}")
+        try:
+            requests.get(url, timeout=1)
+            return proc
+        except requests.RequestException:
+            time.sleep(0.25)
+    proc.terminate()
+    raise RuntimeError(f"server at {url} did not come up within {timeout}s")
+
+
+def request_factories(base_url, imprint, generic_name, image_bytes, user_query):
+    return {
+        "extract_imprint": lambda session: session.post(
+            f"{base_url}/extract_imprint",
+            files={"image": ("pill.jpg", image_bytes, "image/jpeg")},
+        ),
+        "get_pill_info": lambda session: session.post(
+            f"{base_url}/get_pill_info",
+            json={"imprint_code": [{"text": imprint}]},
+        ),
+        "conversation": lambda session: session.post(
+            f"{base_url}/conversation",
+            json={
+                "imprint_number": imprint,
+                "generic_name": generic_name,
+                "user_query": user_query,
+                "not_this_pill": False,
+            },
+        ),
+    }
+
+
+def drive(send, total, concurrency):
+    """
+    Issue ``total`` requests with ``concurrency`` threads.
+
+    Returns:
+        tuple: (latencies_ms, status_counts, wall_seconds)
+    """
+    local = threading.local()
+    latencies = []
+    statuses = {}
+    lock = threading.Lock()
+
+    def one(_):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        start = time.perf_counter()
+        try:
+            status = str(send(session).status_code)
+        except requests.RequestException as e:
+            status = type(e).__name__
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(total)))
+    return latencies, statuses, time.perf_counter() - start
+
+
+def summarize(latencies, statuses, wall, external_calls, total):
+    values = sorted(latencies)
+    errors = sum(n for status, n in statuses.items() if not status.startswith(("2", "3")))
+    return {
+        "requests": total,
+        "errors": errors,
+        "status_counts": statuses,
+        "rps": round(total / wall, 2) if wall else None,
+        "wall_s": round(wall, 3),
+        "latency_ms": {
+            "mean": round(sum(values) / len(values), 2) if values else None,
+            "p50": round(percentile(values, 50), 2) if values else None,
+            "p95": round(percentile(values, 95), 2) if values else None,
+            "p99": round(percentile(values, 99), 2) if values else None,
+            "max": round(values[-1], 2) if values else None,
+        },
+        "external_calls": external_calls,
+        "external_calls_per_request": {
+            name: round(count / total, 3) for name, count in external_calls.items()
+        },
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report):
+    print(f"\n{'endpoint':<17}{'rps':>9}{'p50':>10}{'p95':>10}{'p99':>10}{'err':>6}  external calls/req")
+    for name, result in report["endpoints"].items():
+        lat = result["latency_ms"]
+        calls = ", ".join(f"{k}={v}" for k, v in result["external_calls_per_request"].items())
+        print(
+            f"{name:<17}{result['rps']:>9}{lat['p50']:>10}{lat['p95']:>10}"
+            f"{lat['p99']:>10}{result['errors']:>6}  {calls}"
+        )
+
+
+def compare(base_path, new_path):
+    with open(base_path) as f:
+        base = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    def delta(a, b):
+        if a in (None, 0) or b is None:
+            return "n/a"
+        return f"{(b - a) / a * 100:+.1f}%"
+
+    print(f"base: {base_path} ({base['meta'].get('git_revision')})")
+    print(f"new:  {new_path} ({new['meta'].get('git_revision')})")
+    print(f"\n{'endpoint':<17}{'metric':<8}{'base':>10}{'new':>10}{'delta':>10}")
+    for name in ENDPOINTS:
+        if name not in base["endpoints"] or name not in new["endpoints"]:
+            continue
+        b, n = base["endpoints"][name], new["endpoints"][name]
+        rows = [("rps", b["rps"], n["rps"])] + [
+            (p, b["latency_ms"][p], n["latency_ms"][p]) for p in ("p50", "p95", "p99")
+        ]
+        for metric, bv, nv in rows:
+            print(f"{name:<17}{metric:<8}{bv:>10}{nv:>10}{delta(bv, nv):>10}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100, help="requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS))
+    parser.add_argument("--imprint", default="AN 715")
+    parser.add_argument("--imprint-lines", default="AN,715", help="lines the fake Rekognition returns")
+    parser.add_argument("--generic-name", default="Lisinopril")
+    parser.add_argument("--user-query", default="What are the side effects?")
+    parser.add_argument("--rekognition-latency", type=float, default=0.15, help="seconds")
+    parser.add_argument("--drugs-com-latency", type=float, default=0.3, help="seconds")
+    parser.add_argument("--openfda-latency", type=float, default=0.2, help="seconds")
+    parser.add_argument("--openai-latency", type=float, default=0.8, help="seconds to first byte")
+    parser.add_argument("--openai-chunks", type=int, default=8)
+    parser.add_argument("--openai-chunk-delay", type=float, default=0.02, help="seconds")
+    parser.add_argument(
+        "--redis-db", type=int, default=15, help="Redis database for the app under test; flushed"
+    )
+    parser.add_argument("--serve-cmd", help="start the server with this command instead of in-process")
+    parser.add_argument("--serve-url", default="http://127.0.0.1:6969", help="URL of the --serve-cmd server")
+    parser.add_argument("--label", help="free-form label stored with the results, e.g. 'gunicorn 4x8'")
+    parser.add_argument("--output", help="results file (default bench/results/<timestamp>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"))
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    if args.redis_db == int(os.getenv("REDIS_DB", 0)):
+        sys.exit(f"refusing to flush Redis db {args.redis_db}: it is the app's configured REDIS_DB")
+    flush_redis(args.redis_db)
+    env_redis = {"REDIS_DB": str(args.redis_db)}
+
+    fakes = FakeExternals(
+        imprint_lines=args.imprint_lines.split(","),
+        known_imprints=[args.imprint],
+        generic_name=args.generic_name,
+        rekognition_latency=args.rekognition_latency,
+        drugs_com_latency=args.drugs_com_latency,
+        openfda_latency=args.openfda_latency,
+        openai_latency=args.openai_latency,
+        openai_chunks=args.openai_chunks,
+        openai_chunk_delay=args.openai_chunk_delay,
+    ).start()
+
+    httpd = proc = None
+    try:
+        if args.serve_cmd:
+            base_url = args.serve_url.rstrip("/")
+            proc = start_subprocess(args.serve_cmd, base_url, {**fakes.env(), **env_redis})
+        else:
+            httpd, base_url = start_app({**fakes.env(), **env_redis})
+
+        factories = request_factories(
+            base_url, args.imprint, args.generic_name, make_test_image(), args.user_query
+        )
+        endpoints = [e for e in args.endpoints.split(",") if e]
+
+        # One untimed lookup so /conversation finds its Redis entry
+        with requests.Session() as session:
+            factories["get_pill_info"](session)
+
+        report = {
+            "meta": {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "git_revision": git_revision(),
+                "label": args.label,
+                "target": args.serve_cmd or "in-process werkzeug",
+                "requests_per_endpoint": args.requests,
+                "concurrency": args.concurrency,
+                "fake_latency_s": {
+                    "rekognition": args.rekognition_latency,
+                    "drugs_com": args.drugs_com_latency,
+                    "openfda": args.openfda_latency,
+                    "openai": args.openai_latency,
+                },
+            },
+            "endpoints": {},
+        }
+        for name in endpoints:
+            fakes.reset_calls()
+            latencies, statuses, wall = drive(factories[name], args.requests, args.concurrency)
+            report["endpoints"][name] = summarize(
+                latencies, statuses, wall, fakes.call_counts(), args.requests
+            )
+    finally:
+        if httpd is not None:
+            httpd.shutdown()
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=30)
+        fakes.stop()
+        flush_redis(args.redis_db)
+
+    print_report(report)
+    output = args.output or os.path.join(
+        RESULTS_DIR, datetime.now().strftime("%Y%m%d-%H%M%S") + ".json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Import time and baseline RSS per module, measured in fresh interpreters.
+
+Usage:
+    python -m bench.startup                        # current tree
+    python -m bench.startup --compare-rev 0508af4  # current tree vs a git revision
+    python -m bench.startup --prewarm rekognition,openai,scraper
+
+Each module is imported --repeat times in a new process; the median import
+time and the process's peak RSS after the import are reported. Results can be
+saved as JSON with --output.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+MODULES = (
+    "server",
+    "aws_rekognition.RekognitionTextExtractor",
+    "scrape.HTMLParse",
+    "myHelpers.fdaDataProcessing",
+    "myHelpers.openaiCall",
+    "myHelpers.flow2_not_the_pill",
+    "myHelpers.user_conversation",
+)
+
+# Runs in the child interpreter; prints one JSON line
+PROBE = """
+import json, resource, sys, time
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import importlib
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+if sys.argv[2]:
+    from myHelpers.prewarm import prewarm
+    prewarm(sys.argv[2].split(","))
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is KiB on Linux
+print(json.dumps({
+    "import_ms": elapsed * 1000,
+    "rss_mb": rss * scale / 1024 ** 2,
+    "interpreter_rss_mb": baseline * scale / 1024 ** 2,
+}))
+"""
+
+
+def measure(root, module, repeat, prewarm):
+    runs = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", PROBE, module, prewarm],
+            cwd=root,
+            env={**os.environ, "PYTHONPATH": root, "PYTHONDONTWRITEBYTECODE": "1"},
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+            return {"error": error[0]}
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return {
+        "import_ms": round(statistics.median(r["import_ms"] for r in runs), 1),
+        "rss_mb": round(statistics.median(r["rss_mb"] for r in runs), 1),
+        "interpreter_rss_mb": round(statistics.median(r["interpreter_rss_mb"] for r in runs), 1),
+    }
+
+
+def measure_tree(root, modules, repeat, prewarm):
+    # Compile once up front so the first timed run isn't paying for bytecode
+    subprocess.run([sys.executable, "-m", "compileall", "-q", root], capture_output=True)
+    return {module: measure(root, module, repeat, prewarm) for module in modules}
+
+
+def checkout(rev):
+    path = tempfile.mkdtemp(prefix="startup-")
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", path, rev],
+        cwd=REPO_ROOT,
+        check=True,
+        capture_output=True,
+    )
+    return path
+
+
+def remove_checkout(path):
+    subprocess.run(
+        ["git", "worktree", "remove", "--force", path], cwd=REPO_ROOT, capture_output=True
+    )
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def fmt(result, key):
+    return "error" if "error" in result else f"{result[key]:.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", default=",".join(MODULES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--prewarm", default="", help="components to prewarm after import")
+    parser.add_argument("--compare-rev", help="git revision to measure as the baseline")
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args()
+
+    modules = [m for m in args.modules.split(",") if m]
+    report = {"current": measure_tree(REPO_ROOT, modules, args.repeat, args.prewarm)}
+    if args.compare_rev:
+        path = checkout(args.compare_rev)
+        try:
+            # Older trees have no prewarm hook; measure them as they are
+            report[args.compare_rev] = measure_tree(path, modules, args.repeat, "")
+        finally:
+            remove_checkout(path)
+
+    columns = list(report)
+    header = f"{'module':<42}" + "".join(f"{c[:12] + ' ms':>16}{c[:12] + ' MB':>16}" for c in columns)
+    print(header)
+    for module in modules:
+        row = f"{module:<42}"
+        for column in columns:
+            result = report[column][module]
+            row += f"{fmt(result, 'import_ms'):>16}{fmt(result, 'rss_mb'):>16}"
+        print(row)
+    for column in columns:
+        for module, result in report[column].items():
+            if "error" in result:
+                print(f"{column}: {module}: {result['error']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
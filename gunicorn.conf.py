@@ -0,0 +1,54 @@
+"""
+gunicorn settings for production serving.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Tunables (environment):
+    PORT                  listen port (default 6969)
+    WEB_CONCURRENCY       worker processes (default 2 x CPUs + 1)
+    GUNICORN_THREADS      threads per worker (default 4)
+    GUNICORN_TIMEOUT      seconds before a silent worker is restarted (default 60)
+    GUNICORN_MAX_REQUESTS recycle workers after this many requests (default 2000, 0 disables)
+
+Graceful reload: ``kill -HUP <master pid>`` re-reads this config, starts new
+workers and lets old workers finish in-flight requests (graceful_timeout).
+With ``preload_app`` the new workers fork from the app already imported in
+the master, so they still run the old code. Deploy code changes with a full
+restart or a binary upgrade (``kill -USR2 <master pid>``, then ``-QUIT`` the
+old master once the new one is serving).
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', 6969)}"
+
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+# Requests spend most of their time waiting on Rekognition, drugs.com, openFDA
+# and OpenAI, so threads give cheap extra concurrency per worker
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+
+# Import the app (and the shared read-only state in wsgi.py) once in the master
+preload_app = True
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+graceful_timeout = 30
+keepalive = 5
+
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = max_requests // 10
+
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # Background threads don't survive fork(); start them in each worker
+    from server import start_background_tasks
+
+    start_background_tasks()
+    server.log.info(f"Worker {worker.pid} ready")
+
+
+def worker_abort(worker):
+    worker.log.warning(f"Worker {worker.pid} aborted after {timeout}s timeout")
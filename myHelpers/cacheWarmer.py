@@ -0,0 +1,236 @@
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from myHelpers.fdaDataProcessing import fetch_related_pill_info, get_lasa_data
+from myHelpers.redisClient import redis_client
+from scrape.HTMLParse import HtmlParser
+
+# Sorted sets holding (decayed) request counts
+IMPRINT_FREQ_KEY = "freq:imprint"
+GENERIC_FREQ_KEY = "freq:generic"
+# Only one process warms per interval, even with several workers running
+WARM_LOCK_KEY = "warmer:lock"
+# Counts are multiplied by this after each run so stale popularity fades
+FREQ_DECAY = 0.5
+
+
+# Settings are read when used rather than at import, so a .env loaded by the
+# entry point (server, wsgi or the CLI below) applies to them
+def warm_top_n():
+    return int(os.getenv("CACHE_WARM_TOP_N", 50))
+
+
+def warm_interval():
+    return int(os.getenv("CACHE_WARM_INTERVAL", 600))  # seconds between runs
+
+
+def warm_refresh_ahead():
+    # Refresh entries whose remaining TTL is below this many seconds. Must
+    # exceed the warm interval so entries are refreshed before they expire.
+    return int(os.getenv("CACHE_WARM_REFRESH_AHEAD", 900))
+
+
+def warm_workers():
+    return int(os.getenv("CACHE_WARM_WORKERS", 4))
+
+
+def warm_rate():
+    return float(os.getenv("CACHE_WARM_RATE", 2.0))  # refreshes per second
+
+
+def record_request(imprint_code=None, generic_name=None):
+    """Count a lookup so the warmer can prioritise popular entries."""
+    try:
+        pipe = redis_client.pipeline()
+        if imprint_code:
+            pipe.zincrby(IMPRINT_FREQ_KEY, 1, imprint_code)
+        if generic_name:
+            pipe.zincrby(GENERIC_FREQ_KEY, 1, generic_name)
+        pipe.execute()
+    except Exception as e:
+        # Frequency tracking must never fail a user request
+        print(f"Failed to record request frequency: {e}")
+
+
+class RateLimiter:
+    """Spaces out calls so that at most ``rate`` start per second."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _needs_refresh(key, force):
+    if force:
+        return True
+    # ttl is -2 for a missing key and -1 for one without expiry
+    ttl = redis_client.ttl(key)
+    return ttl == -2 or 0 <= ttl < warm_refresh_ahead()
+
+
+def warm_imprint(imprint_code, force=False):
+    """Refresh the drugs.com lookup, openFDA label and summary for an imprint."""
+    parser = HtmlParser(imprint_code)
+    if not _needs_refresh(parser.cache_key, force):
+        if not parser.lookup():
+            return False
+        summary_key = f"summary:{imprint_code}:{parser.output_name}"
+        if not _needs_refresh(summary_key, force):
+            return False
+        parser.fetch_summary(refresh=True)
+        return True
+
+    if parser.lookup(refresh=True):
+        parser.fetch_summary(refresh=True)
+    return True
+
+
+def warm_generic(generic_name, force=False):
+    """Refresh the bare-name openFDA entry /conversation reads for a LASA look-alike."""
+    if not _needs_refresh(generic_name, force):
+        return False
+    fetch_related_pill_info(generic_name, refresh=True)
+    return True
+
+
+class CacheWarmer:
+    """
+    Proactively refreshes the top-N requested imprints, plus the look-alike
+    entries of popular LASA drugs (or of every drug in misc/LASA.json), before
+    their cache entries expire.
+    Refreshes are rate limited and run on a bounded thread pool.
+    """
+
+    def __init__(
+        self,
+        top_n=None,
+        interval=None,
+        workers=None,
+        rate=None,
+        include_lasa=True,
+    ):
+        # Unset arguments fall back to the CACHE_WARM_* environment variables
+        self.top_n = warm_top_n() if top_n is None else top_n
+        self.interval = warm_interval() if interval is None else interval
+        self.workers = warm_workers() if workers is None else workers
+        self.include_lasa = include_lasa
+        self.limiter = RateLimiter(warm_rate() if rate is None else rate)
+        self._thread = None
+
+    def targets(self):
+        """
+        Returns:
+            tuple: (imprints, generic_names) to keep warm
+        """
+        imprints = redis_client.zrevrange(IMPRINT_FREQ_KEY, 0, self.top_n - 1)
+        generics = redis_client.zrevrange(GENERIC_FREQ_KEY, 0, self.top_n - 1)
+
+        # Bare-name entries are only read by /conversation with not_this_pill,
+        # and only for LASA pills' look-alikes; the <imprint>:<generic> label
+        # and summary other requests read are refreshed by warm_imprint
+        lasa_data = get_lasa_data()
+        names = []
+        for name in generics:
+            if name in lasa_data:
+                names.extend((name, lasa_data[name]))
+        if self.include_lasa:
+            for name, look_alike in lasa_data.items():
+                names.extend((name, look_alike))
+        return imprints, list(dict.fromkeys(names))
+
+    def _run(self, func, name, force):
+        self.limiter.wait()
+        try:
+            return func(name, force=force)
+        except Exception as e:
+            print(f"Cache warm failed for {name}: {e}")
+            return False
+
+    def run_once(self, force=False):
+        """
+        Warm every target once.
+
+        Returns:
+            dict: counts of refreshed and skipped entries
+        """
+        start = time.perf_counter()
+        imprints, generics = self.targets()
+        jobs = [(warm_imprint, i) for i in imprints] + [(warm_generic, g) for g in generics]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = list(pool.map(lambda job: self._run(job[0], job[1], force), jobs))
+
+        self._decay()
+        refreshed = sum(1 for r in results if r)
+        report = {
+            "imprints": len(imprints),
+            "generic_names": len(generics),
+            "refreshed": refreshed,
+            "skipped": len(results) - refreshed,
+            "elapsed_s": round(time.perf_counter() - start, 1),
+        }
+        print(f"Cache warm finished: {report}")
+        return report
+
+    def _decay(self):
+        for key in (IMPRINT_FREQ_KEY, GENERIC_FREQ_KEY):
+            redis_client.zunionstore(key, {key: FREQ_DECAY})
+            redis_client.zremrangebyscore(key, "-inf", 0.1)
+
+    def start(self):
+        """Start the background scheduler thread (idempotent)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._loop, name="cache-warmer", daemon=True
+        )
+        self._thread.start()
+
+    def _loop(self):
+        while True:
+            try:
+                if redis_client.set(WARM_LOCK_KEY, os.getpid(), nx=True, ex=self.interval):
+                    self.run_once()
+            except Exception as e:
+                print(f"Cache warmer run failed: {e}")
+            time.sleep(self.interval)
+
+
+def main():
+    from dotenv import load_dotenv
+
+    # Load environment variables (Redis, openFDA, OpenAI) for this entry point
+    load_dotenv()
+
+    arg_parser = argparse.ArgumentParser(
+        description="One-shot cache warm for popular imprints and LASA drugs."
+    )
+    arg_parser.add_argument("--top", type=int, default=warm_top_n(), help="top-N imprints/generic names")
+    arg_parser.add_argument("--workers", type=int, default=warm_workers())
+    arg_parser.add_argument("--rate", type=float, default=warm_rate(), help="refreshes per second")
+    arg_parser.add_argument("--no-lasa", action="store_true", help="skip misc/LASA.json drugs")
+    arg_parser.add_argument("--force", action="store_true", help="refresh even if not close to expiry")
+    args = arg_parser.parse_args()
+
+    warmer = CacheWarmer(
+        top_n=args.top,
+        workers=args.workers,
+        rate=args.rate,
+        include_lasa=not args.no_lasa,
+    )
+    warmer.run_once(force=args.force)
+
+
+if __name__ == "__main__":
+    main()
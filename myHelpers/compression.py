@@ -0,0 +1,65 @@
+import gzip
+from functools import wraps
+
+from flask import make_response, request
+
+# Responses smaller than this aren't worth the CPU or the gzip header overhead
+GZIP_MIN_SIZE = 512
+GZIP_LEVEL = 6
+
+
+def accepted_encodings(header=None):
+    """
+    Parse an Accept-Encoding header into the set of codings the client accepts
+    (q > 0). ``*`` is expanded to br and gzip.
+    """
+    if header is None:
+        header = request.headers.get("Accept-Encoding", "")
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if q <= 0:
+            continue
+        if coding == "*":
+            accepted.update({"br", "gzip"})
+        else:
+            accepted.add(coding)
+    return accepted
+
+
+def gzip_json(view):
+    """
+    Gzip a view's JSON response when the client accepts gzip and the body is
+    at least GZIP_MIN_SIZE bytes.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = make_response(view(*args, **kwargs))
+        response.headers.add("Vary", "Accept-Encoding")
+        if (
+            response.mimetype != "application/json"
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or "gzip" not in accepted_encodings()
+        ):
+            return response
+
+        body = response.get_data()
+        if len(body) < GZIP_MIN_SIZE:
+            return response
+        response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+        response.headers["Content-Encoding"] = "gzip"
+        return response
+
+    return wrapper
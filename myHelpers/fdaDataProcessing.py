@@ -1,13 +1,20 @@
-import requests
-import redis
 import json
+import os
 from myHelpers.openaiCall import explain_drug_from_json
+from myHelpers.negativeCache import is_generic_miss, record_generic_miss
+from myHelpers.redisClient import redis_client
 
-# Initialize Redis connection
-redis_client = redis.Redis(host="localhost", port=6379, db=0, decode_responses=True)
+# TTL of every positive cache entry written by this module (30 minutes)
+CACHE_TTL = 1800
 
+# Overridable (FDA_BASE_URL) so benchmarks can point lookups at a local
+# stand-in; read per request so a .env loaded by the entry point applies
+DEFAULT_FDA_BASE_URL = "https://api.fda.gov/drug"
 
-def load_lasa_data(file_path="misc/LASA.json"):
+LASA_PATH = os.path.join(os.path.dirname(__file__), "..", "misc", "LASA.json")
+
+
+def load_lasa_data(file_path=LASA_PATH):
     try:
         with open(file_path, "r") as file:
             return json.load(file)
@@ -16,59 +23,120 @@ def load_lasa_data(file_path="misc/LASA.json"):
         return {}
 
 
+_lasa_data = None
+
+
+def get_lasa_data():
+    """
+    Return the LASA table, loaded once per process. Loading it before the
+    server forks its workers lets them share the parsed table copy-on-write.
+    The returned dict is shared and must not be mutated.
+    """
+    global _lasa_data
+    if _lasa_data is None:
+        _lasa_data = load_lasa_data()
+    return _lasa_data
+
+
 def generate_openfda_url(generic_name, limit=1):
-    base_url = "https://api.fda.gov/drug/label.json"
+    base_url = f"{os.getenv('FDA_BASE_URL', DEFAULT_FDA_BASE_URL)}/label.json"
     query = f'search=openfda.generic_name:"{generic_name}"&limit={limit}'
     return f"{base_url}?{query}"
 
 
-def fetch_fda_data(url):
-    response = requests.get(url)
+def request_fda_data(url):
+    """
+    Query openFDA and report whether the outcome is a definitive "no result".
+
+    Returns:
+        tuple: (purpose, data, not_found). ``not_found`` is True only when
+        openFDA answered but had no matching label (HTTP 404 or an empty
+        ``results`` list); transport errors and other status codes leave it
+        False so they are never negatively cached.
+    """
+    import requests
+
+    try:
+        response = requests.get(url, timeout=10)
+    except requests.RequestException as e:
+        print(f"Error fetching FDA data: {e}")
+        return None, None, False
     print("response", response)
     if response.status_code == 200:
         data = response.json()
         results = data.get("results", [])
         if results:
             purpose = results[0].get("indications_and_usage", ["Not Available"])[0]
-            return purpose, data
-        else:
-            return None, None
-    else:
-        return (
-            f"Failed to fetch data. Status code: {response.status_code}",
-            None,
-            None,
-            None,
-        )
+            return purpose, data, False
+        return None, None, True
+    if response.status_code == 404:
+        return None, None, True
+    print(f"Failed to fetch data. Status code: {response.status_code}")
+    return None, None, False
+
+
+def fetch_fda_data(url):
+    purpose, data, _ = request_fda_data(url)
+    return purpose, data
+
+
+def fetch_fda_label(generic_name):
+    """
+    Fetch the openFDA label for a generic name, consulting and populating the
+    negative cache so repeated misses don't hit openFDA again.
+
+    Returns:
+        tuple: (purpose, data) or (None, None) if no label exists.
+    """
+    if is_generic_miss(generic_name):
+        print(f"Negative cache hit for generic name: {generic_name}")
+        return None, None
+
+    url = generate_openfda_url(generic_name)
+    print(f"Generated URL: {url}")
+    purpose, data, not_found = request_fda_data(url)
+    if not_found:
+        record_generic_miss(generic_name)
+    return purpose, data
+
+
+def fetch_related_pill_info(related_pill, refresh=False):
+    """
+    Return the cached ``{"purpose", "data"}`` entry for a pill name, fetching
+    it from openFDA on a miss (or always, when ``refresh`` is set).
+
+    Returns:
+        dict or None if openFDA has no label for the pill.
+    """
+    if not refresh:
+        cached_data = redis_client.get(related_pill)
+        if cached_data:
+            print("Data fetched from cache:")
+            return json.loads(cached_data)
+
+    # If not in cache, fetch from FDA API
+    purpose, data = fetch_fda_label(related_pill)
+    if not data:
+        return None
+    entry = {"purpose": purpose, "data": data}
+    # Store the data in Redis with a TTL of 1800 seconds (30 minutes)
+    redis_client.setex(related_pill, CACHE_TTL, json.dumps(entry))
+    return entry
 
 
 def search_and_fetch_pill_info(pill_name):
     # Load LASA data
-    lasa_data = load_lasa_data()
+    lasa_data = get_lasa_data()
 
     # Check if the pill is in the LASA mapping
     if pill_name in lasa_data:
         related_pill = lasa_data[pill_name]
         print(f"Found related pill: {related_pill}")
 
-        # Check if the pill is in the Redis cache
-        cached_data = redis_client.get(related_pill)
-        if cached_data:
-            print("Data fetched from cache:")
-            cached_data = json.loads(cached_data)
-            print(f"Purpose: {cached_data['purpose']}")
-            return cached_data["purpose"], related_pill
-
-        # If not in cache, fetch from FDA API
-        url = generate_openfda_url(related_pill)
-        print(f"Generated URL: {url}")
-        purpose, data = fetch_fda_data(url)
-        if data:
-            # Store the data in Redis with a TTL of 1800 seconds (30 minutes)
-            redis_client.setex(
-                related_pill, 1800, json.dumps({"purpose": purpose, "data": data})
-            )
-            return purpose, related_pill
+        entry = fetch_related_pill_info(related_pill)
+        if entry:
+            print(f"Purpose: {entry['purpose']}")
+            return entry["purpose"], related_pill
         else:
             print("Failed to retrieve drug information.")
             return None, None
@@ -79,29 +147,44 @@ def search_and_fetch_pill_info(pill_name):
         return purpose, related_pill
 
 
-def generic_fetch_summary(imprint_number, generic_name):
-    url = generate_openfda_url(generic_name)
-    print(f"Generated URL: {url}")
+def generic_fetch_summary(imprint_number, generic_name, refresh=False):
+    """
+    Return the OpenAI explanation for a pill, caching both the openFDA label
+    (under ``<imprint>:<generic>``, also read by /conversation) and the
+    explanation itself (under ``summary:<imprint>:<generic>``).
+
+    With ``refresh`` set, both are re-fetched and their TTLs reset; this is
+    what the cache warmer uses.
+    """
+    cache_key = f"{imprint_number}:{generic_name}"
+    summary_key = f"summary:{cache_key}"
+    print("cache_key: ", cache_key)
+
+    if not refresh:
+        explanation = redis_client.get(summary_key)
+        if explanation:
+            print("Summary fetched from cache")
+            return explanation
 
-    # Fetch data from FDA API
-    purpose, data = fetch_fda_data(url)
-    if data:
-        cache_key = f"{imprint_number}:{generic_name}"
-        print("cache_key: ", cache_key)
         cached_data = redis_client.get(cache_key)
         if cached_data:
             print("Data fetched from cache:")
-            # cached_data = json.loads(cached_data)
             explanation = explain_drug_from_json(json.loads(cached_data))
-            print(f"data: {explanation}")
+            if explanation:
+                redis_client.setex(summary_key, CACHE_TTL, explanation)
             return explanation
-        redis_client.setex(cache_key, 1800, json.dumps(data))
-        print("else")
-        cached_data = redis_client.get(cache_key)
-        explanation = explain_drug_from_json(json.loads(cached_data))
+
+    # Fetch data from FDA API
+    purpose, data = fetch_fda_label(generic_name)
+    if data:
+        redis_client.setex(cache_key, CACHE_TTL, json.dumps(data))
+        explanation = explain_drug_from_json(data)
+        if explanation:
+            redis_client.setex(summary_key, CACHE_TTL, explanation)
         return explanation
     else:
         print("Failed to retrieve drug information.")
+        return None
 
 
 def main():
@@ -1,12 +1,6 @@
-import redis
 import json
-from openai import OpenAI
-
-# Initialize Redis connection
-redis_client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
-
-# Initialize OpenAI client
-client = OpenAI()
+from myHelpers.openaiCall import get_openai_client
+from myHelpers.redisClient import redis_client
 
 # Load LASA data from file
 def load_lasa_data(file_path="misc/LASA.json"):
@@ -32,7 +26,7 @@ The response should only include the name of the closely matching medication."""
     return prompt
 
 def get_matching_medication_from_openai(prompt):
-    response = client.chat.completions.create(
+    response = get_openai_client().chat.completions.create(
         model="gpt-4o-mini",
         messages=[
             {"role": "system", "content": "You are a helpful assistant."},
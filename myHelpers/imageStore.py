@@ -0,0 +1,200 @@
+import hashlib
+import os
+import queue
+import re
+import threading
+import time
+
+# Keys are "<sha256 hex>.<ext>"; anything else is rejected before touching disk
+KEY_PATTERN = re.compile(r"^[0-9a-f]{64}\.(jpg|jpeg|png)$")
+
+IMAGE_STORE_MAX_BYTES = int(os.getenv("IMAGE_STORE_MAX_BYTES", 2 * 1024**3))  # 2 GB
+IMAGE_STORE_MAX_AGE = int(os.getenv("IMAGE_STORE_MAX_AGE", 7 * 24 * 3600))  # 7 days
+IMAGE_STORE_SWEEP_INTERVAL = int(os.getenv("IMAGE_STORE_SWEEP_INTERVAL", 600))
+
+
+class ImageStore:
+    """
+    Content-addressed image store.
+
+    Images are named by the SHA-256 of their bytes and sharded into two levels
+    of directories (``ab/cd/abcd....jpg``), so identical uploads share one file
+    and different uploads never overwrite each other. Writes happen on a
+    background thread unless requested synchronously; until a background
+    write lands the bytes are served from memory by the process that queued it.
+    A sweeper thread deletes files older than ``max_age`` seconds and then the
+    oldest files until the store fits in ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        root,
+        max_bytes=IMAGE_STORE_MAX_BYTES,
+        max_age=IMAGE_STORE_MAX_AGE,
+        sweep_interval=IMAGE_STORE_SWEEP_INTERVAL,
+    ):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.sweep_interval = sweep_interval
+        self._queue = queue.Queue()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._started = False
+        self._stats = {
+            "files": 0,
+            "bytes": 0,
+            "written": 0,
+            "deduplicated": 0,
+            "write_errors": 0,
+            "evicted": 0,
+            "last_sweep": None,
+        }
+
+    def start(self):
+        """Start the writer and sweeper threads (idempotent, fork-safe if lazy)."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        os.makedirs(self.root, exist_ok=True)
+        threading.Thread(target=self._writer, name="image-store-writer", daemon=True).start()
+        threading.Thread(target=self._sweeper, name="image-store-sweeper", daemon=True).start()
+
+    def put(self, data, ext="jpg", sync=False):
+        """
+        Persist ``data`` and return its key.
+
+        By default the write is queued and put returns immediately; until it
+        lands the key is servable from memory, but only by this process.
+        Pass ``sync=True`` for images whose URL is handed to clients: under
+        several worker processes the follow-up request may reach another
+        worker, so the file must be on disk before the response is sent.
+        """
+        self.start()
+        key = f"{hashlib.sha256(data).hexdigest()}.{ext.lower()}"
+        if sync and self._write(key, data):
+            return key
+        with self._lock:
+            if key in self._pending:
+                self._stats["deduplicated"] += 1
+                return key
+            self._pending[key] = data
+        self._queue.put(key)
+        return key
+
+    def path_for(self, key):
+        return os.path.join(self.root, key[:2], key[2:4], key)
+
+    def resolve(self, key):
+        """
+        Look up a key.
+
+        Returns:
+            tuple: (path, data) where exactly one is set if the image exists:
+                   ``data`` while the write is still pending, ``path`` once it
+                   is on disk; (None, None) if unknown or invalid.
+        """
+        if not KEY_PATTERN.match(key):
+            return None, None
+        with self._lock:
+            data = self._pending.get(key)
+        if data is not None:
+            return None, data
+        path = self.path_for(key)
+        if os.path.isfile(path):
+            return path, None
+        return None, None
+
+    def stats(self):
+        """Disk usage and activity counters, as of the last sweep."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        stats["max_bytes"] = self.max_bytes
+        stats["max_age"] = self.max_age
+        return stats
+
+    def _writer(self):
+        while True:
+            key = self._queue.get()
+            with self._lock:
+                data = self._pending.get(key)
+            try:
+                self._write(key, data)
+            finally:
+                with self._lock:
+                    self._pending.pop(key, None)
+                self._queue.task_done()
+
+    def _write(self, key, data):
+        """Write ``data`` under ``key`` atomically; returns False on failure."""
+        try:
+            path = self.path_for(key)
+            try:
+                # Already stored: touch it so the re-upload, whose URL is about
+                # to be handed out, restarts the max_age lifetime
+                os.utime(path)
+                with self._lock:
+                    self._stats["deduplicated"] += 1
+                return True
+            except FileNotFoundError:
+                pass
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._stats["written"] += 1
+                self._stats["files"] += 1
+                self._stats["bytes"] += len(data)
+            return True
+        except OSError as e:
+            print(f"Image store write failed for {key}: {e}")
+            with self._lock:
+                self._stats["write_errors"] += 1
+            return False
+
+    def _sweeper(self):
+        while True:
+            try:
+                self.sweep()
+            except OSError as e:
+                print(f"Image store sweep failed: {e}")
+            time.sleep(self.sweep_interval)
+
+    def sweep(self):
+        """Apply the age and size limits and refresh the disk usage metrics."""
+        now = time.time()
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        kept = []
+        for mtime, size, path in entries:
+            if now - mtime > self.max_age or total > self.max_bytes:
+                try:
+                    os.remove(path)
+                    total -= size
+                    evicted += 1
+                    continue
+                except FileNotFoundError:
+                    total -= size
+                    continue
+            kept.append(size)
+
+        with self._lock:
+            self._stats["files"] = len(kept)
+            self._stats["bytes"] = total
+            self._stats["evicted"] += evicted
+            self._stats["last_sweep"] = now
@@ -0,0 +1,229 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+
+from myHelpers.profiler import profile_with_request
+from scrape.HTMLParse import HtmlParser
+
+# Characters Rekognition commonly confuses on debossed/printed pill imprints
+OCR_CONFUSIONS = {"0": "O", "O": "0", "1": "I", "I": "1", "5": "S", "S": "5"}
+
+# Upper bound on the number of candidates looked up per image
+MAX_CANDIDATES = int(os.getenv("IMPRINT_MAX_CANDIDATES", 8))
+# Number of concurrent drugs.com lookups per image
+LOOKUP_WORKERS = int(os.getenv("IMPRINT_LOOKUP_WORKERS", 4))
+
+# Score multipliers applied to the OCR confidence of a candidate
+MERGED_WEIGHT = 1.05  # per extra line merged; imprints often span two lines
+VARIANT_PENALTY = 0.85  # per character swapped by an OCR-confusion variant
+
+
+class ImprintLookupError(Exception):
+    """
+    Raised when no candidate matched because drugs.com could not be reached,
+    as opposed to drugs.com having no pill for any candidate.
+    """
+
+    def __init__(self, alternatives):
+        super().__init__("drugs.com lookup failed for every imprint candidate")
+        self.alternatives = alternatives
+
+
+def normalize_imprint(text):
+    """
+    Upper-case an OCR line and keep only letters, digits and single spaces.
+
+    Example:
+        "an-715 " -> "AN 715"
+    """
+    return " ".join(re.sub(r"[^A-Z0-9]+", " ", str(text).upper()).split())
+
+
+def order_lines(detections):
+    """
+    Sort Rekognition LINE detections top-to-bottom, then left-to-right, using
+    their bounding boxes. A line starts a new row when its top is more than
+    half a line height below the previous line's top; lines within that
+    tolerance share a row and are ordered by their left edge.
+    """
+    def box(detection):
+        position = detection.get("position") or {}
+        return (
+            position.get("Top", 0),
+            position.get("Left", 0),
+            position.get("Height", 0) or 0.01,
+        )
+
+    rows = []
+    previous = None
+    for detection in sorted(detections, key=lambda d: box(d)[0]):
+        top, _, height = box(detection)
+        if previous is None or top - previous[0] > max(height, previous[2]) / 2:
+            rows.append([])
+        rows[-1].append(detection)
+        previous = box(detection)
+
+    return [d for row in rows for d in sorted(row, key=lambda d: box(d)[1])]
+
+
+def merge_lines(detections):
+    """
+    Build merged line candidates from ordered detections: every single line,
+    every pair of adjacent lines, and all lines together.
+
+    Returns:
+        list of (text, confidence, lines_merged)
+    """
+    lines = [
+        (normalize_imprint(d["text"]), d.get("confidence", 0) / 100.0)
+        for d in order_lines(detections)
+    ]
+    lines = [(text, conf) for text, conf in lines if text]
+
+    merged = [(text, conf, 1) for text, conf in lines]
+    for (a, ca), (b, cb) in zip(lines, lines[1:]):
+        merged.append((f"{a} {b}", (ca + cb) / 2, 2))
+    if len(lines) > 2:
+        text = " ".join(t for t, _ in lines)
+        conf = sum(c for _, c in lines) / len(lines)
+        merged.append((text, conf, len(lines)))
+    return merged
+
+
+def confusion_variants(text, max_swaps=2):
+    """
+    Yield (variant, swaps) pairs obtained by flipping up to ``max_swaps``
+    confusable characters (0/O, 1/I, 5/S). The original text is not yielded.
+    """
+    positions = [i for i, ch in enumerate(text) if ch in OCR_CONFUSIONS]
+    if not positions:
+        return
+    # Bound the combinatorics for long, noisy lines
+    positions = positions[:6]
+    for flips in product((False, True), repeat=len(positions)):
+        swaps = sum(flips)
+        if not swaps or swaps > max_swaps:
+            continue
+        chars = list(text)
+        for pos, flip in zip(positions, flips):
+            if flip:
+                chars[pos] = OCR_CONFUSIONS[chars[pos]]
+        yield "".join(chars), swaps
+
+
+def generate_candidates(detections, limit=MAX_CANDIDATES):
+    """
+    Generate ranked imprint candidates from all Rekognition LINE detections.
+
+    Returns:
+        list of dicts sorted by descending score:
+            [{"imprint": "AN 715", "score": 0.93}, ...]
+    """
+    scores = {}
+    for text, conf, merged in merge_lines(detections):
+        base = min(conf * MERGED_WEIGHT ** (merged - 1), 1.0)
+        scores[text] = max(scores.get(text, 0), base)
+        for variant, swaps in confusion_variants(text):
+            score = base * VARIANT_PENALTY**swaps
+            scores[variant] = max(scores.get(variant, 0), score)
+
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    return [
+        {"imprint": imprint, "score": round(score, 4)}
+        for imprint, score in ranked[:limit]
+    ]
+
+
+def _compact(text):
+    return normalize_imprint(text).replace(" ", "")
+
+
+def _is_confident(candidate, parser):
+    """A hit is confident when drugs.com lists the candidate's exact imprint."""
+    wanted = _compact(candidate["imprint"])
+    return any(_compact(imprint) == wanted for imprint in parser.imprints)
+
+
+def _lookup(candidate):
+    parser = HtmlParser(candidate["imprint"])
+    parser.lookup()
+    return parser
+
+
+def _lookup_waves(candidates):
+    """
+    Split ranked candidates into lookup waves: the top-ranked candidate
+    alone, then groups of LOOKUP_WORKERS.
+    """
+    yield candidates[:1]
+    for i in range(1, len(candidates), LOOKUP_WORKERS):
+        yield candidates[i : i + LOOKUP_WORKERS]
+
+
+def resolve_imprint(detections):
+    """
+    Look up imprint candidates on drugs.com, best-ranked first, and stop at
+    the first confident hit.
+
+    The top-ranked candidate is looked up alone, since it usually is the
+    imprint. Only while no confident hit is held are the following
+    candidates looked up, LOOKUP_WORKERS at a time in parallel; candidates
+    are ranked by score, so a later wave can never outrank a confident hit.
+
+    Returns:
+        tuple: (parser, alternatives)
+            parser: HtmlParser of the best hit (lookup done, no summary yet),
+                    or None if no candidate matched
+            alternatives: ranked list of candidate dicts with "found" set to
+                    True/False for every lookup that ran, or None if the
+                    candidate was skipped after an early exit, plus
+                    "generic_name" for hits
+
+    Raises:
+        ImprintLookupError: if nothing matched and every lookup that ran
+            failed to reach drugs.com
+    """
+    candidates = generate_candidates(detections)
+    if not candidates:
+        return None, []
+
+    for candidate in candidates:
+        candidate["found"] = None
+        candidate["generic_name"] = None
+
+    best = None
+    failed = completed = 0
+    # Pool threads are sampled along with the request when it is profiled
+    lookup = profile_with_request(_lookup)
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        for wave in _lookup_waves(candidates):
+            if best is not None and best[0][0]:
+                break
+            futures = [(c, executor.submit(lookup, c)) for c in wave]
+            for candidate, future in futures:
+                completed += 1
+                try:
+                    parser = future.result()
+                except Exception as e:
+                    print(f"Imprint lookup failed for {candidate['imprint']}: {e}")
+                    candidate["found"] = False
+                    failed += 1
+                    continue
+
+                candidate["found"] = parser.found
+                failed += parser.fetch_failed
+                if parser.found:
+                    candidate["generic_name"] = parser.output_name
+                    rank = (_is_confident(candidate, parser), candidate["score"])
+                    if best is None or rank > best[0]:
+                        best = (rank, parser)
+
+    alternatives = sorted(
+        candidates, key=lambda c: (bool(c["found"]), c["score"]), reverse=True
+    )
+    if best is None:
+        if completed and failed == completed:
+            raise ImprintLookupError(alternatives)
+        return None, alternatives
+    return best[1], alternatives
@@ -0,0 +1,42 @@
+import os
+from myHelpers.redisClient import redis_client
+
+# "No result" outcomes are only remembered for a short while so that a newly
+# listed imprint or label shows up again without manual cache flushing.
+# Overridable via IMPRINT_MISS_TTL / GENERIC_MISS_TTL, read when a miss is recorded.
+DEFAULT_IMPRINT_MISS_TTL = 300  # 5 minutes
+DEFAULT_GENERIC_MISS_TTL = 600  # 10 minutes
+
+
+def normalize_key(value):
+    """
+    Normalize an imprint or generic name so that OCR noise such as extra
+    whitespace or casing differences maps onto the same cache entry.
+    """
+    return " ".join(str(value).split()).upper()
+
+
+def _miss_key(kind, value):
+    return f"miss:{kind}:{normalize_key(value)}"
+
+
+def is_imprint_miss(imprint_code):
+    """Return True if drugs.com recently returned no cards for this imprint."""
+    return bool(redis_client.exists(_miss_key("imprint", imprint_code)))
+
+
+def record_imprint_miss(imprint_code):
+    """Remember that drugs.com returned no cards for this imprint."""
+    ttl = int(os.getenv("IMPRINT_MISS_TTL", DEFAULT_IMPRINT_MISS_TTL))
+    redis_client.setex(_miss_key("imprint", imprint_code), ttl, 1)
+
+
+def is_generic_miss(generic_name):
+    """Return True if openFDA recently returned no label for this generic name."""
+    return bool(redis_client.exists(_miss_key("generic", generic_name)))
+
+
+def record_generic_miss(generic_name):
+    """Remember that openFDA returned no label for this generic name."""
+    ttl = int(os.getenv("GENERIC_MISS_TTL", DEFAULT_GENERIC_MISS_TTL))
+    redis_client.setex(_miss_key("generic", generic_name), ttl, 1)
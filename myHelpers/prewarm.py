@@ -0,0 +1,65 @@
+import time
+
+
+def _prewarm_rekognition():
+    from aws_rekognition.RekognitionTextExtractor import get_rekognition_client
+
+    get_rekognition_client()
+
+
+def _prewarm_openai():
+    from myHelpers.openaiCall import get_openai_client
+
+    get_openai_client()
+
+
+def _prewarm_redis():
+    from myHelpers.redisClient import redis_client
+
+    redis_client.get_client()
+
+
+def _prewarm_scraper():
+    import bs4  # noqa: F401
+    import requests  # noqa: F401
+
+
+def _prewarm_imaging():
+    from PIL import Image
+
+    Image.init()
+
+
+# Heavy modules and clients that are otherwise initialized on first use
+PREWARM_HOOKS = {
+    "rekognition": _prewarm_rekognition,
+    "openai": _prewarm_openai,
+    "redis": _prewarm_redis,
+    "scraper": _prewarm_scraper,
+    "imaging": _prewarm_imaging,
+}
+
+
+def prewarm(names):
+    """
+    Eagerly initialize the named components (see PREWARM_HOOKS), e.g. from the
+    PREWARM environment variable: PREWARM=rekognition,openai,scraper
+
+    Returns:
+        dict: milliseconds spent per component
+    """
+    timings = {}
+    for name in names:
+        name = name.strip()
+        if not name:
+            continue
+        hook = PREWARM_HOOKS.get(name)
+        if hook is None:
+            print(f"Unknown prewarm component: {name}")
+            continue
+        start = time.perf_counter()
+        hook()
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+    if timings:
+        print(f"Prewarmed: {timings}")
+    return timings
@@ -0,0 +1,311 @@
+import heapq
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from functools import wraps
+
+from flask import abort, g, has_request_context, jsonify, request, send_file, url_for
+
+# Fraction of requests profiled at random (0 disables random sampling)
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", 0))
+# Seconds between stack samples of a profiled request
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", 0.005))
+PROFILE_DIR = os.getenv(
+    "PROFILE_DIR", os.path.join(os.path.dirname(__file__), "..", "profiles")
+)
+# Saved profiles kept per route; the oldest are deleted beyond this
+PROFILE_MAX_PER_ROUTE = int(os.getenv("PROFILE_MAX_PER_ROUTE", 50))
+# Admin token guarding the debug header and the /admin endpoints; unset disables both
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+PROFILE_HEADER = "X-Debug-Profile"
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+SLOW_REQUESTS_N = int(os.getenv("SLOW_REQUESTS_N", 20))
+SLOW_REQUESTS_WINDOW = int(os.getenv("SLOW_REQUESTS_WINDOW", 3600))  # seconds
+
+
+class StackSampler:
+    """
+    Samples the stacks of a set of threads from a background thread at a fixed
+    interval and aggregates the samples as collapsed stacks
+    (``outer;inner;leaf count``), the input format of flamegraph.pl and
+    speedscope. Nothing is traced between samples, so overhead is bounded by
+    the sampling rate rather than by the amount of Python executed.
+
+    The set starts with the request's thread; threads doing work on behalf of
+    the request join and leave it through ``add_thread``/``remove_thread``.
+    """
+
+    def __init__(self, thread_id, interval=PROFILE_INTERVAL):
+        self.thread_ids = {thread_id}
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def add_thread(self, thread_id):
+        with self._lock:
+            self.thread_ids.add(thread_id)
+
+    def remove_thread(self, thread_id):
+        with self._lock:
+            self.thread_ids.discard(thread_id)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                thread_ids = tuple(self.thread_ids)
+            frames = sys._current_frames()
+            for thread_id in thread_ids:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                self.stacks[self._collapse(frame)] += 1
+                self.samples += 1
+
+    @staticmethod
+    def _collapse(frame):
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            filename = os.path.basename(code.co_filename)
+            names.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def collapsed(self):
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class SlowRequestLog:
+    """Keeps the N slowest requests seen within a rolling time window."""
+
+    def __init__(self, size=SLOW_REQUESTS_N, window=SLOW_REQUESTS_WINDOW):
+        self.size = size
+        self.window = window
+        self._heap = []  # min-heap of (duration_ms, timestamp, entry)
+        self._lock = threading.Lock()
+
+    def add(self, entry):
+        item = (entry["duration_ms"], entry["timestamp"], entry)
+        with self._lock:
+            self._prune()
+            if len(self._heap) < self.size:
+                heapq.heappush(self._heap, item)
+            elif item[:2] > self._heap[0][:2]:
+                heapq.heapreplace(self._heap, item)
+
+    def report(self):
+        with self._lock:
+            self._prune()
+            items = sorted(self._heap, key=lambda item: item[:2], reverse=True)
+        return [entry for _, _, entry in items]
+
+    def _prune(self):
+        cutoff = time.time() - self.window
+        kept = [item for item in self._heap if item[1] >= cutoff]
+        if len(kept) != len(self._heap):
+            self._heap = kept
+            heapq.heapify(self._heap)
+
+
+slow_requests = SlowRequestLog()
+
+
+def profile_with_request(func):
+    """
+    Wrap ``func`` for execution on another thread (e.g. a thread pool) so that,
+    if the current request is being profiled, the thread running it is
+    sampled together with the request's thread. Outside a profiled request
+    ``func`` is returned unchanged.
+    """
+    sampler = g.get("sampler") if has_request_context() else None
+    if sampler is None:
+        return func
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        thread_id = threading.get_ident()
+        sampler.add_thread(thread_id)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sampler.remove_thread(thread_id)
+
+    return wrapper
+
+
+def _token_ok(token):
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token or "", ADMIN_TOKEN)
+
+
+def _should_profile():
+    if request.headers.get(PROFILE_HEADER) == "1":
+        return _token_ok(request.headers.get(ADMIN_TOKEN_HEADER))
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+def _profile_name(duration_ms):
+    # Second-precision timestamps collide; the random suffix keeps names unique
+    return (
+        f"{time.strftime('%Y%m%d-%H%M%S')}-{int(duration_ms)}ms-{os.getpid()}"
+        f"-{uuid.uuid4().hex[:8]}.collapsed"
+    )
+
+
+def _write_profile(route, name, sampler):
+    """Save a profile as PROFILE_DIR/<route>/<name> and prune old ones."""
+    route_dir = os.path.join(PROFILE_DIR, route)
+    os.makedirs(route_dir, exist_ok=True)
+    with open(os.path.join(route_dir, name), "w") as f:
+        f.write(sampler.collapsed())
+    _prune_profiles(route_dir)
+
+
+def _prune_profiles(route_dir, keep=PROFILE_MAX_PER_ROUTE):
+    """Delete all but the ``keep`` newest profiles in ``route_dir``."""
+    entries = []
+    for name in os.listdir(route_dir):
+        if not name.endswith(".collapsed"):
+            continue
+        path = os.path.join(route_dir, name)
+        try:
+            entries.append((os.path.getmtime(path), path))
+        except FileNotFoundError:
+            continue
+    entries.sort(reverse=True)
+    for _, path in entries[keep:]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Another worker pruned it first
+            pass
+
+
+def init_profiling(app):
+    """
+    Register request hooks and admin endpoints on ``app``:
+
+    - Every request is timed and the slowest are kept for /admin/slow_requests.
+    - A PROFILE_SAMPLE_RATE fraction of requests, or any request sending
+      ``X-Debug-Profile: 1`` with a valid ``X-Admin-Token``, is stack-sampled
+      and written to PROFILE_DIR/<route>/*.collapsed, keeping the newest
+      PROFILE_MAX_PER_ROUTE per route.
+    """
+
+    @app.before_request
+    def start_profiling():
+        g.request_start = time.perf_counter()
+        g.sampler = None
+        if _should_profile():
+            g.sampler = StackSampler(threading.get_ident()).start()
+
+    @app.after_request
+    def finish_profiling(response):
+        start = g.get("request_start")
+        if start is None:
+            return response
+        duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        route = request.endpoint or "unknown"
+        entry = {
+            "route": route,
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": duration_ms,
+            "timestamp": time.time(),
+            "pid": os.getpid(),
+            "profile": None,
+        }
+
+        sampler = g.get("sampler")
+        if sampler is not None:
+            sampler.stop()
+            g.sampler = None
+            name = _profile_name(duration_ms)
+            entry["profile"] = url_for("admin_profile", route=route, name=name)
+            entry["samples"] = sampler.samples
+            response.headers["X-Profile-Samples"] = str(sampler.samples)
+
+            # Disk I/O happens once the response has been sent, so it neither
+            # delays the profiled response nor hides outside duration_ms
+            def save_profile():
+                try:
+                    _write_profile(route, name, sampler)
+                except OSError as e:
+                    app.logger.error(f"Failed to write profile: {str(e)}")
+
+            response.call_on_close(save_profile)
+
+        slow_requests.add(entry)
+        return response
+
+    @app.teardown_request
+    def stop_orphaned_sampler(exc):
+        # after_request is skipped on unhandled exceptions; don't leak the thread
+        sampler = g.get("sampler")
+        if sampler is not None:
+            sampler.stop()
+
+    def require_admin():
+        # Header only: query strings end up in access logs
+        if not _token_ok(request.headers.get(ADMIN_TOKEN_HEADER)):
+            abort(404)
+
+    @app.route("/admin/slow_requests", methods=["GET"])
+    def admin_slow_requests():
+        """Slowest requests in the rolling window for this worker process."""
+        require_admin()
+        return jsonify(
+            {
+                "pid": os.getpid(),
+                "window_s": slow_requests.window,
+                "requests": slow_requests.report(),
+            }
+        )
+
+    @app.route("/admin/profiles/<route>/<name>", methods=["GET"])
+    def admin_profile(route, name):
+        """A single saved profile, as linked from /admin/slow_requests."""
+        require_admin()
+        if not name.endswith(".collapsed"):
+            abort(404)
+        path = os.path.join(PROFILE_DIR, os.path.basename(route), os.path.basename(name))
+        if not os.path.isfile(path):
+            abort(404)
+        return send_file(path, mimetype="text/plain")
+
+    @app.route("/admin/profiles/<route>", methods=["GET"])
+    def admin_route_profile(route):
+        """All saved profiles for a route merged into one collapsed-stack file."""
+        require_admin()
+        route_dir = os.path.join(PROFILE_DIR, os.path.basename(route))
+        if not os.path.isdir(route_dir):
+            abort(404)
+        merged = Counter()
+        for name in os.listdir(route_dir):
+            if not name.endswith(".collapsed"):
+                continue
+            with open(os.path.join(route_dir, name)) as f:
+                for line in f:
+                    stack, _, count = line.rstrip("\n").rpartition(" ")
+                    if stack and count.isdigit():
+                        merged[stack] += int(count)
+        body = "".join(f"{stack} {count}\n" for stack, count in merged.most_common())
+        return body, 200, {"Content-Type": "text/plain; charset=utf-8"}
@@ -0,0 +1,35 @@
+import os
+import threading
+
+
+class LazyRedis:
+    """
+    Shared Redis client that defers ``import redis`` and client construction
+    until the first command. Attribute access is forwarded to the real client,
+    so callers use it exactly like a ``redis.Redis`` instance.
+    """
+
+    def __init__(self):
+        self._client = None
+        self._lock = threading.Lock()
+
+    def get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import redis
+
+                    self._client = redis.Redis(
+                        host=os.getenv("REDIS_HOST", "localhost"),
+                        port=int(os.getenv("REDIS_PORT", 6379)),
+                        db=int(os.getenv("REDIS_DB", 0)),
+                        decode_responses=True,
+                    )
+        return self._client
+
+    def __getattr__(self, name):
+        return getattr(self.get_client(), name)
+
+
+# Initialize Redis connection (on first use)
+redis_client = LazyRedis()
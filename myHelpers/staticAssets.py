@@ -0,0 +1,102 @@
+import mimetypes
+import os
+import re
+
+from flask import abort, send_file
+from werkzeug.routing import PathConverter
+from werkzeug.security import safe_join
+
+from myHelpers.compression import accepted_encodings
+
+# Built Vite app (npm run build in project/)
+FRONTEND_DIST = os.getenv(
+    "FRONTEND_DIST", os.path.join(os.path.dirname(__file__), "..", "project", "dist")
+)
+
+# Vite emits hashed names such as assets/index-DiwrgTda.js; their content never
+# changes under the same name, so they can be cached forever
+HASHED_ASSET = re.compile(r"^assets/.+-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Preferred order for precompressed variants written at build time
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def frontend_path_converter(reserved_prefixes):
+    """
+    Build a URL converter like ``path`` that refuses paths under any of
+    ``reserved_prefixes`` (e.g. API routes). A frontend catch-all using it
+    no longer shadows those routes, so a wrong method still gets a 405 and an
+    unknown API path a 404 instead of index.html.
+    """
+    reserved = "|".join(re.escape(prefix.strip("/")) for prefix in reserved_prefixes)
+
+    class FrontendPathConverter(PathConverter):
+        regex = rf"(?!(?:{reserved})(?:/|$))[^/].*?"
+
+    return FrontendPathConverter
+
+
+def send_static_asset(root, path):
+    """
+    Serve ``path`` from ``root``:
+
+    - Chooses a precompressed ``.br``/``.gz`` sibling when the client accepts
+      it; the siblings themselves are never served directly.
+    - Hashed assets get immutable long-lived caching; everything else (notably
+      index.html) must revalidate.
+    - ETag/If-None-Match is handled by send_file, with one ETag per variant.
+    """
+    full_path = safe_join(root, path)
+    if full_path is None or not os.path.isfile(full_path):
+        abort(404)
+    if full_path.endswith(tuple(suffix for _, suffix in ENCODINGS)):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+    accepted = accepted_encodings()
+    encoding = None
+    serve_path = full_path
+    for coding, suffix in ENCODINGS:
+        if coding in accepted and os.path.isfile(full_path + suffix):
+            encoding, serve_path = coding, full_path + suffix
+            break
+
+    response = send_file(serve_path, mimetype=mimetype, conditional=True, etag=True)
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = (
+        IMMUTABLE if HASHED_ASSET.match(path.replace(os.sep, "/")) else REVALIDATE
+    )
+    return response
+
+
+def send_content_addressed(path_or_file, key, mimetype=None):
+    """
+    Serve a content-addressed file (named by its hash): the key is a strong
+    ETag and the content can be cached forever.
+    """
+    response = send_file(
+        path_or_file,
+        mimetype=mimetype or mimetypes.guess_type(key)[0],
+        download_name=key,
+        conditional=True,
+        etag=key.split(".")[0],
+    )
+    response.headers["Cache-Control"] = IMMUTABLE
+    return response
+
+
+def frontend_response(path="index.html"):
+    """
+    Serve a file from the frontend build, falling back to index.html for
+    client-side routes (paths without a file extension).
+    """
+    full_path = safe_join(FRONTEND_DIST, path)
+    if full_path and os.path.isfile(full_path):
+        return send_static_asset(FRONTEND_DIST, path)
+    if "." in os.path.basename(path):
+        abort(404)
+    return send_static_asset(FRONTEND_DIST, "index.html")
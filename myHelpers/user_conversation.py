@@ -1,12 +1,6 @@
-import redis
 import json
-from openai import OpenAI
-
-# Initialize Redis connection
-redis_client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
-
-# Initialize OpenAI client
-client = OpenAI()
+from myHelpers.openaiCall import get_openai_client
+from myHelpers.redisClient import redis_client
 
 def store_content_and_question(content, question):
     # Generate a unique key for the question
@@ -24,7 +18,7 @@ Please answer the following question based strictly on the content provided abov
     return prompt
 
 def get_answer_from_openai(prompt):
-    response = client.chat.completions.create(
+    response = get_openai_client().chat.completions.create(
         model="gpt-4o-mini",
         messages=[
             {"role": "system", "content": "You are a helpful assistant."},
@@ -1,8 +1,18 @@
 export interface MedicineResponse {
+  found?: boolean;
   imprint_number: string;
   generic_name: string;
   summary: string;
+  summary_found?: boolean;
   image_url: string;
+  alternatives?: ImprintCandidate[];
+}
+
+export interface ImprintCandidate {
+  imprint: string;
+  score: number;
+  found: boolean | null;
+  generic_name: string | null;
 }
 
 export interface ChatResponse {
@@ -1,9 +1,50 @@
-import { defineConfig } from 'vite';
+import { defineConfig, type Plugin } from 'vite';
 import react from '@vitejs/plugin-react';
+import { readdirSync, readFileSync, statSync, writeFileSync } from 'node:fs';
+import { join } from 'node:path';
+import { brotliCompressSync, constants, gzipSync } from 'node:zlib';
+
+const COMPRESSIBLE = /\.(js|mjs|css|html|svg|json|txt|map|webmanifest)$/;
+const MIN_SIZE = 1024;
+
+// Write .br and .gz siblings for every compressible build file so the Flask
+// server can serve them by content negotiation without compressing per request.
+function precompress(): Plugin {
+  let outDir = 'dist';
+  return {
+    name: 'precompress',
+    apply: 'build',
+    configResolved(config) {
+      outDir = config.build.outDir;
+    },
+    closeBundle() {
+      const walk = (dir: string) => {
+        for (const name of readdirSync(dir)) {
+          const path = join(dir, name);
+          if (statSync(path).isDirectory()) {
+            walk(path);
+            continue;
+          }
+          if (!COMPRESSIBLE.test(name)) continue;
+          const source = readFileSync(path);
+          if (source.length < MIN_SIZE) continue;
+          writeFileSync(
+            `${path}.br`,
+            brotliCompressSync(source, {
+              params: { [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY },
+            }),
+          );
+          writeFileSync(`${path}.gz`, gzipSync(source, { level: 9 }));
+        }
+      };
+      walk(outDir);
+    },
+  };
+}
 
 // https://vitejs.dev/config/
 export default defineConfig({
-  plugins: [react()],
+  plugins: [react(), precompress()],
   optimizeDeps: {
     exclude: ['lucide-react'],
   },
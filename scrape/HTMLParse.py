@@ -1,27 +1,39 @@
-from typing import Optional, List, Dict
-import requests
-from bs4 import BeautifulSoup, Tag
-from requests.exceptions import RequestException
+from typing import TYPE_CHECKING, Optional, List, Dict
 import sys
 import os
+import json
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from myHelpers.fdaDataProcessing import generic_fetch_summary
+from myHelpers.fdaDataProcessing import CACHE_TTL, generic_fetch_summary
+from myHelpers.negativeCache import is_imprint_miss, normalize_key, record_imprint_miss
+from myHelpers.redisClient import redis_client
+
+if TYPE_CHECKING:
+    # bs4 and requests are imported on first scrape to keep worker startup fast
+    from bs4 import BeautifulSoup, Tag
+
+# Overridable (DRUGS_COM_BASE_URL) so benchmarks can point the scraper at a
+# local stand-in; read per parser so a .env loaded by the entry point applies
+DEFAULT_DRUGS_COM_BASE_URL: str = "https://www.drugs.com"
 
 
 class HtmlParser:
     def __init__(self, imprint: str) -> None:
         self.imprint_code: str = imprint
+        base_url: str = os.getenv("DRUGS_COM_BASE_URL", DEFAULT_DRUGS_COM_BASE_URL)
         self.url: str = (
-            f"https://www.drugs.com/imprints.php?imprint={self.imprint_code}&color=&shape=0"
+            f"{base_url}/imprints.php?imprint={self.imprint_code}&color=&shape=0"
         )
-        self.soup: Optional[BeautifulSoup] = None
+        self.soup: Optional["BeautifulSoup"] = None
         self.imprints: List[str] = []
         self.pill_names: List[str] = []
         self.pill_descriptions: List[Dict[str, str]] = []
         self.output_imprint: Optional[str] = None  # Example: Manufacturer name
         self.output_name: Optional[str] = None  # Example: Drug classification
         self.output_summary: Optional[str] = None
+        self.summary_found: bool = False  # False if no openFDA-backed summary
+        self.found: bool = False  # True once drugs.com returned at least one card
+        self.fetch_failed: bool = False  # True if drugs.com could not be reached
 
     def _fetch_html(self) -> bool:
         """
@@ -34,6 +46,10 @@ class HtmlParser:
             Prints nothing on success
             Prints error message on failure
         """
+        import requests
+        from bs4 import BeautifulSoup
+        from requests.exceptions import RequestException
+
         try:
             headers: Dict[str, str] = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
@@ -48,29 +64,65 @@ class HtmlParser:
             print(f"Error fetching URL: {e}")
             return False
 
-    def parse_content(self) -> None:
+    @property
+    def cache_key(self) -> str:
+        return f"imprint:{normalize_key(self.imprint_code)}"
+
+    def _load_cached(self) -> bool:
+        cached = redis_client.get(self.cache_key)
+        if not cached:
+            return False
+        entry = json.loads(cached)
+        self.imprints = entry["imprints"]
+        self.pill_names = entry["pill_names"]
+        self.pill_descriptions = entry["pill_descriptions"]
+        return True
+
+    def _store_cached(self) -> None:
+        entry = {
+            "imprints": self.imprints,
+            "pill_names": self.pill_names,
+            "pill_descriptions": self.pill_descriptions,
+        }
+        redis_client.setex(self.cache_key, CACHE_TTL, json.dumps(entry))
+
+    def lookup(self, refresh: bool = False) -> bool:
         """
-        Parses HTML content according to specifications:
+        Scrapes the drugs.com imprint page without fetching the FDA summary:
         - get imprints
         - get pill name (generic name as per fda guidelines)
         - get pill description
 
+        Parsed cards are cached in Redis; ``refresh`` bypasses the cache and
+        the negative cache and re-scrapes (used by the cache warmer).
+
         Returns:
-            None
+            bool: True if drugs.com returned at least one pill card
 
         Expected Output:
             Populates class attributes:
             - imprints: List of imprint codes
             - pill_names: List of pill names
             - pill_descriptions: List of dictionaries with description key-value pairs
+            - found: False if drugs.com has no cards for the imprint; the miss
+              is negatively cached so repeats skip the scrape entirely
+            - fetch_failed: True if the page could not be fetched; this is
+              not a miss and is never negatively cached
         """
-        self._fetch_html()  # Fetching HTML content
-        if not self.soup:
+        if not refresh:
+            if is_imprint_miss(self.imprint_code):
+                print("Negative cache hit for imprint:", self.imprint_code)
+                return False
+            if self._load_cached():
+                return self._finish_lookup()
+
+        if not self._fetch_html():  # Fetching HTML content
             print("HTML content not loaded")
-            return
+            self.fetch_failed = True
+            return False
 
         # Parse imprints
-        imprint_divs: List[Tag] = self.soup.find_all(
+        imprint_divs: List["Tag"] = self.soup.find_all(
             "div", class_="ddc-pid-card-header"
         )
         self.imprints = [
@@ -80,29 +132,71 @@ class HtmlParser:
         ]
 
         # Parse pill names
-        name_links: List[Tag] = self.soup.find_all("a", class_="ddc-text-size-small")
+        name_links: List["Tag"] = self.soup.find_all("a", class_="ddc-text-size-small")
         self.pill_names = [link.get_text(strip=True) for link in name_links]
 
         # Parse pill descriptions
-        desc_dls: List[Tag] = self.soup.find_all("dl")
+        desc_dls: List["Tag"] = self.soup.find_all("dl")
         for dl in desc_dls:
             items: Dict[str, str] = {}
-            dts: List[Tag] = dl.find_all("dt")
-            dds: List[Tag] = dl.find_all("dd")
+            dts: List["Tag"] = dl.find_all("dt")
+            dds: List["Tag"] = dl.find_all("dd")
 
             for dt, dd in zip(dts, dds):
                 key: str = dt.get_text(strip=True)
                 value: str = dd.get_text(strip=True)
                 items[key] = value
             self.pill_descriptions.append(items)
+
+        if not self.pill_names:
+            print("No pills found for imprint:", self.imprint_code)
+            record_imprint_miss(self.imprint_code)
+            return False
+
+        self._store_cached()
+        return self._finish_lookup()
+
+    def _finish_lookup(self) -> bool:
+        if not self.pill_names:
+            return False
+        self.found = True
         print("htlm parser=", self.imprint_code, self.pill_names[0])
         self.output_imprint = self.imprint_code
         self.output_name = self.pill_names[0]
+        return True
+
+    def fetch_summary(self, refresh: bool = False) -> None:
+        """
+        Fetches the FDA-backed summary for the first matched pill.
+
+        Returns:
+            None
+
+        Expected Output:
+            Populates output_summary and summary_found; no-op if lookup()
+            found nothing
+        """
+        if not self.found:
+            return
         self.output_summary = generic_fetch_summary(
-            self.imprint_code, self.pill_names[0]
+            self.imprint_code, self.pill_names[0], refresh=refresh
         )
+        self.summary_found = self.output_summary is not None
         print(self.imprint_code, self.pill_names[0], self.output_summary)
 
+    def parse_content(self) -> None:
+        """
+        Scrapes the imprint page and fetches the summary for the first match.
+
+        Returns:
+            None
+
+        Expected Output:
+            Populates the attributes set by lookup() plus output_summary
+        """
+        if self.lookup():
+            self.fetch_summary()
+
     def print_results(self) -> None:
         """
         Prints parsed results to console
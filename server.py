@@ -1,24 +1,39 @@
-from flask import Flask, request, jsonify, send_from_directory
-from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
+
+# Load environment variables from a .env file, if available. This runs before
+# the project imports below because several modules read settings at import.
+load_dotenv()
+
+from flask import Flask, request, jsonify, url_for
 from flask_cors import CORS
+from PIL import Image, UnidentifiedImageError
 import logging
 from aws_rekognition.RekognitionTextExtractor import RekognitionTextExtractor
+from aws_rekognition.ImagePreprocessor import ImagePreprocessor
 from scrape.HTMLParse import HtmlParser
 import os
-import redis
-from datetime import datetime
+import time
+from io import BytesIO
 from myHelpers.openaiCall import explain_drug_from_json
-from myHelpers.fdaDataProcessing import search_and_fetch_pill_info
+from myHelpers.fdaDataProcessing import get_lasa_data, search_and_fetch_pill_info
+from myHelpers.imprintCandidates import ImprintLookupError, resolve_imprint
+from myHelpers.imageStore import ImageStore
+from myHelpers.cacheWarmer import CacheWarmer, record_request
+from myHelpers.redisClient import redis_client
+from myHelpers.prewarm import prewarm
+from myHelpers.profiler import init_profiling
+from myHelpers.compression import gzip_json
+from myHelpers.staticAssets import (
+    frontend_path_converter,
+    frontend_response,
+    send_content_addressed,
+)
 
 
 # TODO:
 # 1. Connect /extract_imprint to /get_pill_info aka pass the extracted text to get_pill_info endpoint
 # 2. Implement endpoint for CHATBOT
 
-# Load environment variables from a .env file, if available
-load_dotenv()
-
 # Configure logging: Set the logging level to INFO and create a logger for this module
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,6 +45,22 @@ app = Flask(__name__)
 app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024
 CORS(app)
 
+# Request timing, on-demand stack sampling and the /admin profiling endpoints
+init_profiling(app)
+
+# First path segments owned by the API. The frontend catch-all never matches
+# them, so e.g. GET /get_pill_info is a 405 and /uploads a 404, not index.html
+API_PREFIXES = (
+    "admin",
+    "conversation",
+    "extract_imprint",
+    "get_pill_info",
+    "health",
+    "metrics",
+    "uploads",
+)
+app.url_map.converters["frontend"] = frontend_path_converter(API_PREFIXES)
+
 # Directory to save images
 UPLOAD_FOLDER = os.path.join(os.getcwd(), 'static', 'images')
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -43,33 +74,123 @@ app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
 # Define allowed image file extensions for uploads
 ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg"}
-redis_client = redis.Redis(
-    host=os.getenv("REDIS_HOST", "localhost"),
-    port=int(os.getenv("REDIS_PORT", 6379)),
-    decode_responses=True,
-)
 
 # Configure upload settings
 UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), "static")
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 
+# Content-addressed, size/age-bounded store for processed uploads and thumbnails
+image_store = ImageStore(
+    os.getenv("IMAGE_STORE_DIR", os.path.join(UPLOAD_FOLDER, "store"))
+)
+
+# Background refresh of popular imprints and LASA drugs before they expire
+cache_warmer = CacheWarmer()
+
+# Per-process counters reported by /health
+WORKER_STATE = {"pid": os.getpid(), "started": time.time(), "requests": 0}
+
+
+def start_background_tasks():
+    """
+    Start per-process background threads. Threads do not survive fork(), so
+    under gunicorn this runs in each worker (post_fork), not at import time.
+    """
+    WORKER_STATE.update(pid=os.getpid(), started=time.time(), requests=0)
+    # Heavy clients are created on first use; PREWARM lists the ones to build
+    # now. Clients own sockets, so they are built per worker, after the fork.
+    prewarm(os.getenv("PREWARM", "").split(","))
+    if os.getenv("CACHE_WARMER_ENABLED", "0") == "1":
+        cache_warmer.start()
+
+
+@app.before_request
+def count_request():
+    WORKER_STATE["requests"] += 1
+
 def allowed_file(filename):
     """Check if the file extension is allowed."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def pill_not_found(imprint_code, **extra) -> tuple:
+    """
+    Build the structured "not found" response shared by the lookup endpoints.
+    """
+    body = {
+        "error": "No pill found for the provided imprint",
+        "found": False,
+        "imprint_number": imprint_code,
+        "generic_name": None,
+        "summary": None,
+    }
+    body.update(extra)
+    return jsonify(body), 404
+
+
+def pill_lookup_failed(imprint_code, **extra) -> tuple:
+    """
+    Build the response for a lookup that could not reach drugs.com. Unlike a
+    miss this says nothing about the imprint, so clients may retry.
+    """
+    body = {
+        "error": "Pill lookup service unavailable",
+        "found": None,
+        "imprint_number": imprint_code,
+        "generic_name": None,
+        "summary": None,
+    }
+    body.update(extra)
+    return jsonify(body), 502
+
+
 @app.route("/", methods=["GET"])
 def serve_frontend() -> tuple:
     """
     Serve React frontend homepage
     """
-    return send_from_directory("../frontend/build", "index.html")
+    return frontend_response("index.html")
+
+
+@app.route("/<frontend:path>", methods=["GET"])
+def serve_frontend_asset(path):
+    """
+    Serve frontend build assets (precompressed, long-cached when hashed) and
+    fall back to index.html for client-side routes
+    """
+    return frontend_response(path)
 
 # @app.route('/images/<filename>')
 # def serve_image(filename):
 #     return send_from_directory('static/images', filename)
 
 
+@app.route("/health", methods=["GET"])
+def health():
+    """
+    Health of the worker process that served this request.
+
+    Returns:
+        - 200 with worker pid, uptime and request count when Redis is reachable.
+        - 503 with the same body and "status": "degraded" otherwise.
+    """
+    try:
+        redis_ok = bool(redis_client.ping())
+    except Exception as e:
+        logger.error(f"Health check Redis ping failed: {str(e)}")
+        redis_ok = False
+
+    body = {
+        "status": "ok" if redis_ok else "degraded",
+        "pid": WORKER_STATE["pid"],
+        "uptime_s": round(time.time() - WORKER_STATE["started"], 1),
+        "requests": WORKER_STATE["requests"],
+        "redis": redis_ok,
+        "image_store_pending": image_store.stats()["pending"],
+    }
+    return jsonify(body), 200 if redis_ok else 503
+
+
 @app.route("/extract_imprint", methods=["POST"])
 def extract_imprint():
     try:
@@ -84,35 +205,67 @@ def extract_imprint():
         if not allowed_file(file.filename):
             return jsonify({"error": "Invalid file type"}), 400
 
-        # Create dated subdirectory
-        today = datetime.today().strftime("%Y-%m-%d")
-        save_dir = os.path.join(app.config["UPLOAD_FOLDER"], today)
-        os.makedirs(save_dir, exist_ok=True)
-
-        # Secure filename and save
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(save_dir, filename)
-        file.save(filepath)
-
-        # Process image
-        with open(filepath, "rb") as f:
-            image_bytes = f.read()
-
-        extractor = RekognitionTextExtractor(image_bytes)
+        # Process image straight from the request; only processed images are
+        # persisted, through the image store
+        image_bytes = file.read()
+
+        # Downscale, strip EXIF and build the UI thumbnail from a single decode
+        try:
+            prepared = ImagePreprocessor(image_bytes).process()
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError):
+            # Not an image, truncated, or too many pixels to decode safely
+            return jsonify({"error": "Could not decode image"}), 400
+        # The thumbnail URL goes back to the client and may be fetched from
+        # another worker, so it is on disk before we respond; the larger
+        # processed image is written in the background
+        image_store.put(prepared["image"])
+        thumb_key = image_store.put(prepared["thumbnail"], sync=True)
+
+        extractor = RekognitionTextExtractor(prepared["image"])
         results = extractor.extract_text()
-        parser = HtmlParser(results[0]["text"])
-        parser.parse_content()
+        stats = prepared["stats"]
+        logger.info(
+            f"Rekognition payload {stats['processed_bytes']}B "
+            f"(raw {stats['raw_bytes']}B, -{stats['reduction_pct']}%), "
+            f"preprocess {stats['elapsed_ms']}ms, detect_text {extractor.latency_ms}ms"
+        )
 
         # Generate accessible URL
-        image_url = "http://localhost:6969" + f"/uploads/{today}/{filename}"
+        image_url = url_for("serve_image", key=thumb_key, _external=True)
+
+        if not results:
+            return pill_not_found(
+                None, error="No imprint text detected in image", image_url=image_url
+            )
+
+        # Score every detected line (and merged/OCR-corrected variants)
+        # against drugs.com instead of trusting the first detection
+        try:
+            parser, alternatives = resolve_imprint(results)
+        except ImprintLookupError as e:
+            return pill_lookup_failed(
+                e.alternatives[0]["imprint"],
+                image_url=image_url,
+                alternatives=e.alternatives,
+            )
+        if parser is None:
+            imprint_code = alternatives[0]["imprint"] if alternatives else None
+            return pill_not_found(
+                imprint_code, image_url=image_url, alternatives=alternatives
+            )
+        parser.fetch_summary()
+        record_request(parser.output_imprint, parser.output_name)
 
         return (
             jsonify(
                 {
-                    "imprint_number": results[0]["text"],
+                    "found": True,
+                    "imprint_number": parser.output_imprint,
                     "generic_name": parser.output_name,
                     "summary": parser.output_summary,
+                    "summary_found": parser.summary_found,
                     "image_url": image_url,
+                    "alternatives": alternatives,
                 }
             ),
             200,
@@ -124,17 +277,27 @@ def extract_imprint():
 
 
 # Add route to serve uploaded images
-@app.route("/uploads/<date>/<filename>")
-def serve_image(date, filename):
-    try:
-        return send_from_directory(
-            os.path.join(app.config["UPLOAD_FOLDER"], date), filename
-        )
-    except FileNotFoundError:
+@app.route("/uploads/<key>")
+def serve_image(key):
+    path, data = image_store.resolve(key)
+    if data is not None:
+        # Background write still pending: serve from memory
+        return send_content_addressed(BytesIO(data), key)
+    if path is None:
         return jsonify({"error": "Image not found"}), 404
+    return send_content_addressed(path, key)
+
+
+@app.route("/metrics/image_store", methods=["GET"])
+def image_store_metrics():
+    """
+    Disk usage and write/eviction counters for the upload image store.
+    """
+    return jsonify(image_store.stats())
 
 
 @app.route("/get_pill_info", methods=["POST"])
+@gzip_json
 def get_pill_info():
     """
     Endpoint to retrieve pill information based on an imprint code.
@@ -151,6 +314,10 @@ def get_pill_info():
 
     Returns:
         - On success: A JSON response containing pill details like name and description.
+        - If no pill matches: A 404 JSON response with "found": false.
+        - If the pill matched but openFDA has no label for it: "found": true
+          with "summary": null and "summary_found": false.
+        - If drugs.com could not be reached: A 502 JSON response.
         - On error: A JSON response with an error message and appropriate HTTP status code.
     """
     # Attempt to parse JSON data from the request body; silent=True prevents errors if JSON is invalid
@@ -183,19 +350,27 @@ def get_pill_info():
     parser = HtmlParser(imprint_code)
     # Parse the content to retrieve pill information
     parser.parse_content()
+    if parser.fetch_failed:
+        return pill_lookup_failed(imprint_code)
+    if not parser.found:
+        return pill_not_found(imprint_code)
+    record_request(imprint_code, parser.output_name)
 
     # Return the pill information as a JSON response
     return jsonify(
         {
+            "found": True,
             # Optionally include the imprint code if needed:
             "imprint_number": imprint_code,
             "generic_name": parser.output_name,
             "summary": parser.output_summary,
+            "summary_found": parser.summary_found,
         }
     )
 
 
 @app.route("/conversation", methods=["POST"])
+@gzip_json
 def conversation():
     try:
         # Get input data
@@ -210,9 +385,13 @@ def conversation():
         # Construct cache key and fetch from Redis
         cache_key = f"{imprint_number}:{generic_name}"
         logger.info(f"Fetching data from Redis with key: {cache_key}")
+        # Popularity is only recorded for names a lookup has validated, so
+        # arbitrary client input never becomes a cache warming target
         if not_this_pill:
             new_purpose, related_pill = search_and_fetch_pill_info(generic_name)
             if new_purpose:
+                if generic_name in get_lasa_data():
+                    record_request(generic_name=generic_name)
                 return jsonify(
                     {
                         "message": "Incorrect pill information detected. Fetched updated information.",
@@ -238,6 +417,7 @@ def conversation():
                 ),
                 404,
             )
+        record_request(generic_name=generic_name)
 
         if not_this_pill:
             new_purpose = search_and_fetch_pill_info(generic_name)
@@ -292,5 +472,10 @@ if __name__ == "__main__":
         )
         exit(1)
 
-    # Start the Flask application with debugging enabled (good for development)
+    # Start the Flask application with debugging enabled (good for development).
+    # For production use gunicorn: gunicorn -c gunicorn.conf.py wsgi:app
+    # The reloader runs this module twice: a watcher process that never serves
+    # requests, and the serving child, which has WERKZEUG_RUN_MAIN set
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_background_tasks()
     app.run(host="0.0.0.0", port=int(os.getenv("PORT", 6969)), debug=True)
@@ -0,0 +1,89 @@
+import os
+import time
+
+import pytest
+
+from myHelpers.imageStore import ImageStore
+
+DAY = 24 * 3600
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    def make(**kwargs):
+        kwargs.setdefault("sweep_interval", 3600)
+        store = ImageStore(str(tmp_path / "store"), **kwargs)
+        store.start()
+        # Let the sweeper's first pass finish so it can't race the test
+        deadline = time.time() + 5
+        while store.stats()["last_sweep"] is None and time.time() < deadline:
+            time.sleep(0.01)
+        return store
+
+    return make
+
+
+def age(store, key, seconds):
+    path = store.path_for(key)
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_put_sync_writes_before_returning(make_store):
+    store = make_store()
+    key = store.put(b"thumbnail", sync=True)
+    path, data = store.resolve(key)
+    assert data is None
+    with open(path, "rb") as f:
+        assert f.read() == b"thumbnail"
+    assert store.stats()["pending"] == 0
+
+
+def test_put_background_serves_from_disk_once_written(make_store):
+    store = make_store()
+    key = store.put(b"processed")
+    store._queue.join()
+    path, data = store.resolve(key)
+    assert path == store.path_for(key) and data is None
+
+
+def test_resolve_rejects_invalid_keys(make_store):
+    store = make_store()
+    assert store.resolve("../../etc/passwd") == (None, None)
+    assert store.resolve("0" * 64 + ".jpg") == (None, None)
+
+
+def test_sweep_evicts_old_files(make_store):
+    store = make_store(max_age=7 * DAY)
+    old = store.put(b"old", sync=True)
+    new = store.put(b"new", sync=True)
+    age(store, old, 8 * DAY)
+    store.sweep()
+    assert store.resolve(old) == (None, None)
+    assert store.resolve(new)[0] is not None
+    assert store.stats()["evicted"] == 1
+
+
+def test_sweep_evicts_oldest_files_over_size_limit(make_store):
+    store = make_store(max_bytes=10)
+    keys = [store.put(bytes([i]) * 4, sync=True) for i in range(3)]
+    for i, key in enumerate(keys):
+        age(store, key, (3 - i) * 60)  # keys[0] is the oldest
+    store.sweep()
+    assert store.resolve(keys[0]) == (None, None)
+    assert all(store.resolve(key)[0] is not None for key in keys[1:])
+    assert store.stats()["bytes"] == 8
+
+
+@pytest.mark.parametrize("sync", [True, False])
+def test_duplicate_put_restarts_lifetime(make_store, sync):
+    store = make_store(max_age=7 * DAY)
+    key = store.put(b"same image", sync=True)
+    age(store, key, 8 * DAY)
+
+    assert store.put(b"same image", sync=sync) == key
+    store._queue.join()
+    store.sweep()
+
+    assert store.resolve(key)[0] is not None
+    assert store.stats()["deduplicated"] == 1
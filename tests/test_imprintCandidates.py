@@ -0,0 +1,180 @@
+import pytest
+
+from myHelpers import imprintCandidates
+from myHelpers.imprintCandidates import (
+    ImprintLookupError,
+    confusion_variants,
+    generate_candidates,
+    merge_lines,
+    order_lines,
+    resolve_imprint,
+)
+
+
+def line(text, top, left, height=0.05, confidence=99.0):
+    return {
+        "text": text,
+        "confidence": confidence,
+        "position": {"Top": top, "Left": left, "Height": height, "Width": 0.1},
+    }
+
+
+class FakeParser:
+    def __init__(self, imprint, imprints=(), name=None, fetch_failed=False):
+        self.imprint_code = imprint
+        self.imprints = list(imprints)
+        self.found = bool(imprints)
+        self.output_name = name
+        self.fetch_failed = fetch_failed
+
+
+def texts(detections):
+    return [d["text"] for d in detections]
+
+
+def test_order_lines_same_row_straddling_bucket_boundary():
+    # 0.112 and 0.113 differ by far less than half a line height
+    detections = [line("B", 0.113, 0.5), line("A", 0.112, 0.1)]
+    assert texts(order_lines(detections)) == ["A", "B"]
+
+
+def test_order_lines_rows_top_to_bottom_then_left_to_right():
+    detections = [
+        line("D", 0.40, 0.6),
+        line("B", 0.11, 0.6),
+        line("C", 0.41, 0.1),
+        line("A", 0.10, 0.1),
+    ]
+    assert texts(order_lines(detections)) == ["A", "B", "C", "D"]
+
+
+def test_order_lines_missing_position_keeps_all_lines():
+    detections = [{"text": "X"}, line("A", 0.5, 0.1)]
+    assert sorted(texts(order_lines(detections))) == ["A", "X"]
+
+
+def test_merge_lines_singles_pairs_and_all():
+    detections = [
+        line("an", 0.1, 0.1, confidence=90),
+        line("715", 0.3, 0.1, confidence=80),
+        line("10-mg", 0.5, 0.1, confidence=70),
+    ]
+    merged = merge_lines(detections)
+    assert [text for text, _, _ in merged] == [
+        "AN",
+        "715",
+        "10 MG",
+        "AN 715",
+        "715 10 MG",
+        "AN 715 10 MG",
+    ]
+    assert merged[3][1:] == (pytest.approx(0.85), 2)
+    assert merged[-1][1:] == (pytest.approx(0.8), 3)
+
+
+def test_merge_lines_drops_empty_lines():
+    detections = [line("--", 0.1, 0.1), line("AN 715", 0.3, 0.1)]
+    assert [text for text, _, _ in merge_lines(detections)] == ["AN 715"]
+
+
+def test_confusion_variants_swaps_up_to_limit():
+    variants = dict(confusion_variants("1O5"))
+    assert set(variants) == {"IO5", "105", "1OS", "I05", "IOS", "10S"}
+    assert variants["IO5"] == 1
+    assert variants["I05"] == 2
+    assert "I0S" not in variants  # three swaps
+
+
+def test_confusion_variants_none_for_unconfusable_text():
+    assert list(confusion_variants("AN 7")) == []
+
+
+def test_generate_candidates_ranked_and_limited():
+    detections = [line("AN", 0.1, 0.1), line("715", 0.3, 0.1)]
+    candidates = generate_candidates(detections, limit=3)
+    assert len(candidates) == 3
+    assert candidates[0]["imprint"] == "AN 715"
+    scores = [c["score"] for c in candidates]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_generate_candidates_penalises_variants():
+    candidates = generate_candidates([line("S10", 0.1, 0.1)])
+    scores = {c["imprint"]: c["score"] for c in candidates}
+    assert scores["S10"] > scores["510"] > scores["51O"]
+
+
+def fake_lookup(hits, calls, failed=()):
+    def lookup(candidate):
+        calls.append(candidate["imprint"])
+        imprint = candidate["imprint"]
+        if imprint in hits:
+            return FakeParser(imprint, hits[imprint], name="Drug " + imprint)
+        return FakeParser(imprint, fetch_failed=imprint in failed)
+
+    return lookup
+
+
+def test_resolve_imprint_confident_top_candidate_is_looked_up_alone(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        imprintCandidates, "_lookup", fake_lookup({"AN 715": ["AN 715"]}, calls)
+    )
+    parser, alternatives = resolve_imprint([line("AN", 0.1, 0.1), line("715", 0.3, 0.1)])
+    assert calls == ["AN 715"]
+    assert parser.imprint_code == "AN 715"
+    assert alternatives[0]["found"] is True
+    assert all(c["found"] is None for c in alternatives[1:])
+
+
+def test_resolve_imprint_reports_found_for_every_lookup_that_ran(monkeypatch):
+    monkeypatch.setattr(imprintCandidates, "LOOKUP_WORKERS", 2)
+    calls = []
+    detections = [line("AN", 0.1, 0.1), line("715", 0.3, 0.1)]
+    ranked = [c["imprint"] for c in generate_candidates(detections)]
+    hit = ranked[2]  # second wave
+    monkeypatch.setattr(
+        imprintCandidates, "_lookup", fake_lookup({hit: [hit]}, calls)
+    )
+    parser, alternatives = resolve_imprint(detections)
+    assert calls == ranked[:3]
+    assert parser.imprint_code == hit
+    by_imprint = {c["imprint"]: c["found"] for c in alternatives}
+    assert [by_imprint[i] for i in ranked[:3]] == [False, False, True]
+    assert all(by_imprint[i] is None for i in ranked[3:])
+
+
+def test_resolve_imprint_keeps_looking_after_inexact_hit(monkeypatch):
+    calls = []
+    detections = [line("AN", 0.1, 0.1), line("715", 0.3, 0.1)]
+    ranked = [c["imprint"] for c in generate_candidates(detections)]
+    # drugs.com answers the top candidate with a different imprint
+    hits = {ranked[0]: ["XYZ"], ranked[1]: [ranked[1]]}
+    monkeypatch.setattr(imprintCandidates, "_lookup", fake_lookup(hits, calls))
+    parser, _ = resolve_imprint(detections)
+    assert parser.imprint_code == ranked[1]
+    assert len(calls) > 1
+
+
+def test_resolve_imprint_miss(monkeypatch):
+    calls = []
+    monkeypatch.setattr(imprintCandidates, "_lookup", fake_lookup({}, calls))
+    parser, alternatives = resolve_imprint([line("AN 715", 0.1, 0.1)])
+    assert parser is None
+    assert len(calls) == len(alternatives)
+    assert all(c["found"] is False for c in alternatives)
+
+
+def test_resolve_imprint_all_fetches_failed(monkeypatch):
+    detections = [line("AN 715", 0.1, 0.1)]
+    ranked = [c["imprint"] for c in generate_candidates(detections)]
+    monkeypatch.setattr(
+        imprintCandidates, "_lookup", fake_lookup({}, [], failed=set(ranked))
+    )
+    with pytest.raises(ImprintLookupError) as excinfo:
+        resolve_imprint(detections)
+    assert len(excinfo.value.alternatives) == len(ranked)
+
+
+def test_resolve_imprint_no_text():
+    assert resolve_imprint([line("--", 0.1, 0.1)]) == (None, [])
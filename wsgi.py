@@ -0,0 +1,29 @@
+"""
+Production WSGI entry point.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+With ``preload_app`` the master imports this module once before forking, so
+read-only state loaded here is shared copy-on-write by every worker.
+"""
+import gc
+import os
+
+from dotenv import load_dotenv
+
+# Load environment variables before any project module reads them
+load_dotenv()
+
+from server import app  # noqa: E402,F401
+from myHelpers.fdaDataProcessing import get_lasa_data  # noqa: E402
+from myHelpers.prewarm import prewarm  # noqa: E402
+
+# Read-only data and module state shared by all workers
+get_lasa_data()
+# Import the scraper (bs4, requests) and Pillow plugins once in the master;
+# clients that own sockets are created per worker on first use
+prewarm(os.getenv("PRELOAD", "scraper,imaging").split(","))
+
+# Move everything loaded so far into the permanent generation so the garbage
+# collector doesn't touch (and un-share) those pages in the workers
+gc.freeze()